@@ -30,15 +30,8 @@ except ImportError:
     PSUTIL_AVAILABLE = False
 
 # Gemini for intent detection
-GEMINI_AVAILABLE = False
 gemini_model = None
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    pass
-
 from database import db
 from ai_brain import brain
 
@@ -111,10 +104,6 @@ class CommandHandler:
     
     def _init_gemini(self):
         """Initialize Gemini for command processing"""
-        if not GEMINI_AVAILABLE:
-            print("[!] Gemini library not available")
-            return
-        
         # Get API key
         gemini_key = os.environ.get("GOOGLE_API_KEY", "")
         
@@ -138,9 +127,13 @@ class CommandHandler:
         
         if gemini_key and gemini_key.startswith("AIza"):
             try:
+                # The SDK is slow to import - only load it once there is a key
+                import google.generativeai as genai
                 genai.configure(api_key=gemini_key)
                 self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
                 print("[OK] Command Analyzer ready (Gemini 1.5 Flash)")
+            except ImportError:
+                print("[!] Gemini library not available")
             except Exception as e:
                 print(f"[!] Gemini init error: {e}")
         else:
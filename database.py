@@ -6,6 +6,7 @@ Handles local SQLite and external database connections
 # Standard library imports
 import json
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -27,6 +28,7 @@ class DatabaseManager:
     def __init__(self):
         self.local_db_path = LOCAL_DB_PATH
         self.external_engine = None
+        self.reminders_changed = threading.Event()  # Set when a reminder is added
         self._init_local_db()
         self._init_external_db()
     
@@ -389,6 +391,7 @@ class DatabaseManager:
         conn.commit()
         conn.close()
         
+        self.reminders_changed.set()
         return reminder_id
     
     def get_pending_reminders(self) -> List[Dict]:
@@ -409,6 +412,23 @@ class DatabaseManager:
         
         return reminders
     
+    def seconds_until_next_reminder(self) -> Optional[float]:
+        """Get seconds until the earliest pending reminder is due (None if none)"""
+        conn = sqlite3.connect(self.local_db_path)
+        cursor = conn.cursor()
+        
+        # Same clock as get_pending_reminders so both agree on what is due
+        cursor.execute("""
+            SELECT (julianday(MIN(remind_at)) - julianday('now')) * 86400
+            FROM reminders
+            WHERE is_completed = FALSE
+        """)
+        
+        seconds = cursor.fetchone()[0]
+        conn.close()
+        
+        return seconds
+    
     def mark_reminder_complete(self, reminder_id: int) -> bool:
         """Mark a reminder as completed"""
         conn = sqlite3.connect(self.local_db_path)
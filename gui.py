@@ -63,25 +63,39 @@ except ImportError:
 
 
 class ModernGUI:
-    """Modern GUI for F.R.I.D.A.Y. using CustomTkinter"""
+    """Modern GUI for F.R.I.D.A.Y. using CustomTkinter
+
+    Exactly one queue pump runs per instance: ``self._poll`` is bound once
+    to either the CustomTkinter or the basic tkinter handler.
+    """
+    
+    # Message bubble grid options (user bubbles right, assistant left)
+    _GRID_USER = dict(sticky="e", padx=(100, 10), pady=8)
+    _GRID_ASSIST = dict(sticky="w", padx=(10, 100), pady=8)
     
     def __init__(self, on_text_command: Callable[[str], None] = None,
                  on_mic_toggle: Callable[[], None] = None,
-                 on_stop_speaking: Callable[[], None] = None):
+                 on_stop_speaking: Callable[[], None] = None,
+                 on_settings_saved: Callable[[], None] = None):
         
         self.on_text_command = on_text_command
         self.on_mic_toggle = on_mic_toggle
         self.on_stop_speaking = on_stop_speaking
-        self.message_queue = queue.Queue()
+        self.on_settings_saved = on_settings_saved
+        self.message_queue = queue.SimpleQueue()
         self.is_listening = False
         self.is_awake = False
         self.stop_typing = False  # Flag to stop word-by-word typing
+        self._last_listen_state = None  # Last (listening, awake, lang) shown in the indicator
+        self.ready_evt = threading.Event()  # Set once the mainloop is running
         self.lang = get_language()  # Get current language
         
         # Setup window
         if CTK_AVAILABLE:
+            self._poll = self._process_queue
             self._setup_modern_gui()
         else:
+            self._poll = self._process_queue_basic
             self._setup_basic_gui()
     
     def _setup_modern_gui(self):
@@ -97,7 +111,8 @@ class ModernGUI:
         # Smooth window appearance
         try:
             self.root.attributes('-alpha', 0.0)
-            self.root.after(50, lambda: self._fade_in_window())
+            self._fade_alpha = 0.0
+            self.root.after(50, self._fade_in_window)
         except:
             pass
         
@@ -109,17 +124,17 @@ class ModernGUI:
         self._create_chat_area()
         self._create_input_area()
         self._create_status_bar()
-        self._process_queue()
+        self._poll()
         # Check for updates after 3 seconds (let app start first)
         self.root.after(3000, lambda: self._check_for_updates(show_no_update_msg=False))
     
-    def _fade_in_window(self, alpha=0.0):
+    def _fade_in_window(self):
         """Smooth fade-in effect for window"""
-        if alpha < 1.0:
-            alpha += 0.1
+        if self._fade_alpha < 1.0:
+            self._fade_alpha += 0.1
             try:
-                self.root.attributes('-alpha', alpha)
-                self.root.after(20, lambda: self._fade_in_window(alpha))
+                self.root.attributes('-alpha', self._fade_alpha)
+                self.root.after(20, self._fade_in_window)
             except:
                 pass
     
@@ -343,10 +358,7 @@ class ModernGUI:
             border_color=(ACCENT_HOVER if is_user else "#2a2a4a")
         )
         
-        if is_user:
-            msg_frame.grid(sticky="e", padx=(100, 10), pady=8)
-        else:
-            msg_frame.grid(sticky="w", padx=(10, 100), pady=8)
+        msg_frame.grid(**(self._GRID_USER if is_user else self._GRID_ASSIST))
         
         msg_label = ctk.CTkLabel(
             msg_frame,
@@ -358,7 +370,7 @@ class ModernGUI:
         )
         msg_label.pack(padx=18, pady=12)
         
-        self.root.after(100, lambda: self.chat_frame._parent_canvas.yview_moveto(1.0))
+        self.root.after(100, self._scroll_bottom)
         
         # Word-by-word typing effect for assistant messages
         if typing_effect and not is_user:
@@ -369,10 +381,22 @@ class ModernGUI:
     def _type_words(self, label, text: str, words_per_minute: int = 750):
         """Display text word by word - synced with speech timing"""
         self.stop_typing = False  # Reset stop flag
-        words = text.split()
-        current_text = ""
         
-        word_count = len(words)
+        # End offset of each word in the original text - slicing avoids
+        # rebuilding the prefix string word by word
+        offsets = []
+        in_word = False
+        for i, ch in enumerate(text):
+            if ch.isspace():
+                if in_word:
+                    offsets.append(i)
+                in_word = False
+            else:
+                in_word = True
+        if in_word:
+            offsets.append(len(text))
+        
+        word_count = len(offsets)
         if word_count == 0:
             return
         
@@ -382,28 +406,32 @@ class ModernGUI:
         ms_per_word = 330  # Match natural speech pace
         
         def show_word(index):
-            nonlocal current_text
             # Check if stopped
             if self.stop_typing:
                 # Show full text immediately when stopped
                 try:
                     label.configure(text=text)
-                    self.chat_frame._parent_canvas.yview_moveto(1.0)
+                    self._scroll_bottom()
                 except:
                     pass
                 return
             
-            if index < len(words):
-                current_text += (" " if current_text else "") + words[index]
+            if index < word_count:
                 try:
-                    label.configure(text=current_text)
-                    self.chat_frame._parent_canvas.yview_moveto(1.0)
+                    # The scrollable frame re-measures itself only when the
+                    # label grows a line - this just keeps the newest line in view
+                    label.configure(text=text[:offsets[index]])
+                    self._scroll_bottom()
                 except:
                     return
-                self.root.after(ms_per_word, lambda: show_word(index + 1))
+                self.root.after(ms_per_word, show_word, index + 1)
         
         # Start typing with minimal delay
-        self.root.after(initial_delay, lambda: show_word(0))
+        self.root.after(initial_delay, show_word, 0)
+    
+    def _scroll_bottom(self):
+        """Scroll the chat area to the newest message"""
+        self.chat_frame._parent_canvas.yview_moveto(1.0)
     
     def _on_text_submit(self, event=None):
         """Handle text submission"""
@@ -678,12 +706,18 @@ class ModernGUI:
         except queue.Empty:
             pass
         
-        self.root.after(100, self._process_queue)
+        self.root.after(100, self._poll)
     
     def _update_listening_status(self, is_listening: bool):
         """Update the listening status indicator"""
         self.is_listening = is_listening
         
+        # Skip redundant configure calls - this fires on every listen cycle
+        state = (is_listening, self.is_awake, self.lang)
+        if state == self._last_listen_state:
+            return
+        self._last_listen_state = state
+        
         if is_listening:
             if self.is_awake:
                 self.status_indicator.configure(
@@ -715,6 +749,8 @@ class ModernGUI:
         try:
             from settings import show_settings_dialog
             if show_settings_dialog(self.root):
+                if self.on_settings_saved:
+                    self.on_settings_saved()
                 # Settings saved - update language if changed
                 new_lang = get_language()
                 if new_lang != self.lang:
@@ -791,7 +827,7 @@ class ModernGUI:
         )
         self.status_label.pack(pady=5)
         
-        self._process_queue_basic()
+        self._poll()
     
     def _on_text_submit_basic(self, event=None):
         """Handle text submission (basic GUI)"""
@@ -829,7 +865,7 @@ class ModernGUI:
                     self._add_message_basic(data)
         except queue.Empty:
             pass
-        self.root.after(100, self._process_queue_basic)
+        self.root.after(100, self._poll)
     
     # Public methods
     def add_user_message(self, text: str):
@@ -855,6 +891,7 @@ class ModernGUI:
     
     def run(self):
         """Start the GUI main loop"""
+        self.root.after(0, self.ready_evt.set)
         self.root.mainloop()
     
     def quit(self):
@@ -7,20 +7,26 @@ stable_v1.2.0 - Multi-AI Edition (Ollama, Gemini, ChatGPT)
 Optimized for Windows & Linux
 """
 
+import atexit
+import importlib
 import logging
+import logging.handlers
 import os
 import sys
 import threading
 import time
 import tkinter as tk
 import math
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from queue import Queue
+from queue import Empty, Queue
 
 # =============================================================================
 # WINDOWS COMPATIBILITY: Set environment before any imports
 # =============================================================================
-if sys.platform == 'win32':
+IS_WINDOWS = sys.platform == 'win32'
+
+if IS_WINDOWS:
     # Fix for Windows console encoding
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -33,6 +39,19 @@ if sys.platform == 'win32':
     
     # Fix for PyInstaller MEI crashes
     os.environ.setdefault('PYINSTALLER_CLEANUP', '0')
+    
+    # Resolve the user32 calls used for the borderless splash once
+    import ctypes
+    _user32 = ctypes.windll.user32
+    _user32.GetParent.argtypes = [ctypes.c_void_p]
+    _user32.GetParent.restype = ctypes.c_void_p
+    _user32.GetWindowLongW.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _user32.GetWindowLongW.restype = ctypes.c_long
+    _user32.SetWindowLongW.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_long]
+    _user32.SetWindowLongW.restype = ctypes.c_long
+
+# Skip the macOS system Tk deprecation check when Tk starts
+os.environ.setdefault('TK_SILENCE_DEPRECATION', '1')
 
 # =============================================================================
 # CRITICAL: Load Gemini API key BEFORE any other imports
@@ -66,13 +85,20 @@ _preload_api_keys()
 log_file = Path.home() / "friday-assistant" / "friday.log"
 log_file.parent.mkdir(parents=True, exist_ok=True)
 
+# Log calls only enqueue; a listener thread does the file/console writes
+_log_queue = Queue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(log_file, encoding='utf-8'),
+    logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -83,7 +109,7 @@ def cleanup_old_mei_folders():
     This prevents the 'failed to remove temporary directory' warning.
     Windows only.
     """
-    if sys.platform != 'win32':
+    if not IS_WINDOWS:
         return
     
     try:
@@ -123,7 +149,7 @@ def cleanup_old_mei_folders():
 
 def setup_windows_optimizations():
     """Windows-specific optimizations for better performance"""
-    if sys.platform != 'win32':
+    if not IS_WINDOWS:
         return
     
     try:
@@ -173,6 +199,24 @@ class LoadingScreen:
     TEXT = "#88ccff"
     DIM = "#334455"
     
+    # Unit-circle offsets of the reactor segments - rotated per frame with
+    # cos(a+b) = cos a*cos b - sin a*sin b instead of calling trig per segment
+    _RING8 = tuple((math.cos(math.radians(i * 45)), math.sin(math.radians(i * 45))) for i in range(8))
+    _RING6 = tuple((math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60))) for i in range(6))
+    
+    # The scan-line gradient repeats every 2*pi seconds; it is pre-baked into
+    # this many PhotoImage phases and cycled instead of recoloring every line
+    SCAN_PHASES = 32
+    
+    # Color lookup tables indexed by intensity/alpha - no hex formatting per draw
+    _SCAN_COLORS = tuple(f"#{a:02x}{a:02x}{a + 3:02x}" for a in range(16))
+    _CORE_COLORS = tuple(f"#00{a:02x}{min(255, a + 50):02x}" for a in range(128))
+    _TITLE_FADE = tuple(f"#00{int(100 * a / 15):02x}{int(150 * a / 15):02x}" for a in range(16))
+    _SUB_FADE = tuple(f"#{int(50 * a / 15):02x}{int(100 * a / 15):02x}{int(130 * a / 15):02x}" for a in range(16))
+    
+    # The pulsing core glow is one image item cycling this many pulse sprites
+    CORE_FRAMES = 16
+    
     def __init__(self):
         self.root = None
         self.canvas = None
@@ -182,11 +226,31 @@ class LoadingScreen:
         self.status_text = "INITIALIZING..."
         self.progress = 0.0
         self.ready = False
-        self.status_queue = Queue()
+        self._ready_t0 = 0.0
+        self.status_queue = None  # Only used when Tcl can't take calls from other threads
+        # Cleared by initialize_app during CPU-heavy imports to yield the GIL
+        self._draw_enabled = threading.Event()
+        self._draw_enabled.set()
         self.fade_alpha = 0.0  # For smooth fade-in
+        self._ids = {}  # Persistent canvas item IDs, created once in _build_scene
+        self._scan_frames = [None] * self.SCAN_PHASES  # Baked lazily on first use
+        self._scan_phase = None
+        self._core_frames = [None] * self.CORE_FRAMES  # Baked lazily on first use
+        self._core_index = None
+        self._saved_xmodifiers = None
+        self._frame_interval_ms = 33  # ~30 FPS is plenty for a splash
+        # Last drawn values - unchanged parts of the scene are not touched
+        self._last_status = None
+        self._last_title_step = None
+        self._last_sub_step = None
+        self._title_text = None  # Resolved once from settings when the title appears
         
     def create(self):
         """Create the loading window"""
+        # The splash takes no text input - don't let Tk open an X input method
+        self._saved_xmodifiers = os.environ.get('XMODIFIERS', '')
+        os.environ['XMODIFIERS'] = '@im=none'
+        
         # Use CTk to avoid segfault when switching to ModernGUI later
         try:
             import customtkinter as ctk
@@ -210,19 +274,20 @@ class LoadingScreen:
         self.root.attributes('-topmost', True)
         
         # Try to set rounded window on Windows
-        try:
-            import platform
-            if platform.system() == 'Windows':
-                import ctypes
-                hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
-                style = ctypes.windll.user32.GetWindowLongW(hwnd, -16)
+        if IS_WINDOWS:
+            try:
+                hwnd = _user32.GetParent(self.root.winfo_id())
+                style = _user32.GetWindowLongW(hwnd, -16)
                 style = style & ~0x00C00000  # Remove WS_CAPTION
-                ctypes.windll.user32.SetWindowLongW(hwnd, -16, style)
-        except:
-            pass
+                _user32.SetWindowLongW(hwnd, -16, style)
+            except:
+                pass
         
         self.canvas = tk.Canvas(self.root, width=w, height=h, bg=self.BG, highlightthickness=0)
         self.canvas.pack()
+        # Raw Tcl entry points for the per-frame hot path (skips tkinter's option wrapping)
+        self._tkcall = self.canvas.tk.call
+        self._cvw = self.canvas._w
         
         # Start with transparent window for fade-in effect
         try:
@@ -230,37 +295,146 @@ class LoadingScreen:
         except:
             pass
         
-        self.t0 = time.time()
-        self._render()
+        self._build_scene(w, h)
+        
+        self.t0 = time.monotonic()
+        # First frame once the window is mapped, not while create() still runs
+        self.root.after_idle(self._render)
+        self._apply_status(None, None)
+        
+        # A threaded Tcl marshals after() from worker threads onto the Tk
+        # thread itself; only non-threaded builds need the polled queue
+        if not self.root.tk.call('info', 'exists', 'tcl_platform(threaded)'):
+            self.status_queue = Queue()
+            self._check_queue()
         
     def set_status(self, text: str, progress: float = None):
         """Update status from any thread"""
-        self.status_queue.put((text, progress))
+        if self.root is None:
+            # Not shown yet - create() draws whatever is stored here
+            self.status_text = text or self.status_text
+            if progress is not None:
+                self.progress = progress
+        elif self.status_queue is not None:
+            self.status_queue.put((text, progress))
+        else:
+            try:
+                self.root.after(0, self._apply_status, text, progress)
+            except (RuntimeError, tk.TclError):
+                pass  # Splash already closed
         
     def set_ready(self):
         """Signal that loading is complete"""
+        self._ready_t0 = time.monotonic()
         self.ready = True
         
     def close(self):
         """Close the loading screen"""
         self.active = False
+        # Give the main GUI the user's input method back
+        if self._saved_xmodifiers is not None:
+            os.environ['XMODIFIERS'] = self._saved_xmodifiers
+            self._saved_xmodifiers = None
         try:
             if self.root:
                 self.root.quit()
         except:
             pass
     
+    def _apply_status(self, text, progress):
+        """Show a status update - runs on the Tk thread"""
+        if not self.active:
+            return
+        if text:
+            self.status_text = text
+        if progress is not None:
+            self.progress = progress
+        
+        try:
+            status = (self.status_text, self.progress)
+            if status != self._last_status:
+                self._last_status = status
+                self._draw_status(650, 420)
+        except tk.TclError:
+            self.active = False
+    
     def _check_queue(self):
-        """Check for status updates"""
+        """Fallback for non-threaded Tcl - poll status updates on a slow timer"""
+        if not self.active:
+            return
+        # Only the newest text/progress is ever visible - coalesce the backlog
+        last_text, last_progress = None, None
         try:
-            while not self.status_queue.empty():
+            while True:
                 text, progress = self.status_queue.get_nowait()
                 if text:
-                    self.status_text = text
+                    last_text = text
                 if progress is not None:
-                    self.progress = progress
-        except:
+                    last_progress = progress
+        except Empty:
             pass
+        self._apply_status(last_text, last_progress)
+        
+        try:
+            if self.active:
+                self.root.after(100, self._check_queue)
+        except tk.TclError:
+            self.active = False
+    
+    def _build_scene(self, w, h):
+        """Create every canvas item once - frames only move/recolor them"""
+        cv = self.canvas
+        ids = self._ids
+        cx, cy = w // 2, h // 2 - 40
+        
+        # Gradient background - a single image item cycling baked phases
+        ids['scan_bg'] = cv.create_image(0, 0, anchor="nw")
+        
+        # Arc reactor - static glow and rings
+        for i in range(3):
+            r = 70 + i * 5
+            alpha = 30 - i * 10
+            cv.create_oval(cx - r, cy - r, cx + r, cy + r,
+                outline=f"#00{alpha:02x}{alpha + 20:02x}", width=1)
+        cv.create_oval(cx - 60, cy - 60, cx + 60, cy + 60, outline=self.SECONDARY, width=2)
+        cv.create_oval(cx - 45, cy - 45, cx + 45, cy + 45, outline=self.PRIMARY, width=2)
+        
+        # Arc reactor - animated segments and pulsing core
+        ids['seg8'] = [cv.create_line(cx, cy, cx, cy, fill=self.PRIMARY, width=2) for _ in range(8)]
+        ids['seg6'] = [cv.create_line(cx, cy, cx, cy, fill=self.ACCENT, width=2) for _ in range(6)]
+        ids['core'] = cv.create_image(cx, cy)
+        cv.create_oval(cx - 6, cy - 6, cx + 6, cy + 6, fill=self.ACCENT, outline="")
+        
+        # Title and subtitle stay hidden until their fade-in starts
+        title_y = cy + 95
+        ids['title_glow'] = cv.create_text(cx, title_y, text="F.R.I.D.A.Y.",
+            font=("Segoe UI", 38, "bold"), fill=self.BG, state="hidden")
+        ids['title'] = cv.create_text(cx, title_y, text="F.R.I.D.A.Y.",
+            font=("Segoe UI", 38, "bold"), fill=self.PRIMARY, state="hidden")
+        ids['subtitle'] = cv.create_text(cx, title_y + 45, text="AI Voice Assistant",
+            font=("Segoe UI", 14), fill=self.BG, state="hidden")
+        
+        # Status panel
+        panel_y = h - 85
+        panel_w = 400
+        px = (w - panel_w) // 2
+        bar_y = panel_y + 25
+        bar_h = 4
+        ids['status_text'] = cv.create_text(w // 2, panel_y, text=self.status_text,
+            font=("Segoe UI", 11), fill=self.TEXT)
+        cv.create_rectangle(px, bar_y, px + panel_w, bar_y + bar_h,
+            fill=self.DIM, outline="")
+        ids['bar_glow'] = cv.create_rectangle(px, bar_y - 1, px, bar_y + bar_h + 1,
+            fill="#003355", outline="", state="hidden", tags="bar_fill")
+        ids['bar_fg'] = cv.create_rectangle(px, bar_y, px, bar_y + bar_h,
+            fill=self.PRIMARY, outline="", state="hidden", tags="bar_fill")
+        ids['percent_text'] = cv.create_text(px + panel_w + 35, bar_y + 2, text="0%",
+            font=("Segoe UI", 10), fill=self.PRIMARY)
+        cv.create_text(w // 2, h - 25, text="F.R.I.D.A.Y. • AI ASSISTANT",
+            font=("Segoe UI", 9), fill=self.DIM)
+        
+        # Corner accents never change
+        self._draw_frame(w, h)
     
     def _render(self):
         """Render frame with smooth animations"""
@@ -268,9 +442,27 @@ class LoadingScreen:
             return
             
         try:
-            self._check_queue()
+            if not self._draw_enabled.is_set():
+                self.root.after(50, self._render)
+                return
+            
+            now = time.monotonic()
+            elapsed = now - self.t0
             
-            elapsed = time.time() - self.t0
+            # Once loading is done (and the 2 second minimum has passed) the
+            # main GUI is being built - only fade the window out, skip drawing
+            fade_start = max(self._ready_t0, self.t0 + 2.0)
+            if self.ready and now >= fade_start:
+                fade = self.fade_alpha * max(0.0, 1.0 - (now - fade_start) / 0.5)
+                if fade <= 0:
+                    self.close()
+                    return
+                try:
+                    self.root.attributes('-alpha', fade)
+                except:
+                    pass
+                self.root.after(self._frame_interval_ms, self._render)
+                return
             
             # Smooth fade-in effect (0.5 seconds)
             if self.fade_alpha < 1.0:
@@ -280,53 +472,48 @@ class LoadingScreen:
                 except:
                     pass
             
-            # If ready, fade out then close
-            if self.ready and elapsed > 2.0:
-                self.close()
-                return
-            
-            self.canvas.delete("all")
-            
             w, h = 650, 420
             cx, cy = w // 2, h // 2 - 40
+            cv = self.canvas
+            ids = self._ids
             
             # Smooth gradient background
-            for i in range(0, h, 2):
-                intensity = int(10 + 5 * math.sin(i * 0.05 + elapsed))
-                color = f"#{intensity:02x}{intensity:02x}{intensity + 3:02x}"
-                self.canvas.create_line(0, i, w, i, fill=color)
+            phase = int(elapsed * self.SCAN_PHASES / (2 * math.pi)) % self.SCAN_PHASES
+            if phase != self._scan_phase:
+                self._scan_phase = phase
+                cv.itemconfig(ids['scan_bg'], image=self._scan_frame(phase, w, h))
             
             # Draw arc reactor with glow
             self._draw_reactor(cx, cy, elapsed)
             
             # Title with fade-in
-            title_y = cy + 95
             if elapsed > 0.3:
-                title_alpha = min(1.0, (elapsed - 0.3) / 0.5)
-                title_text = "F.R.I.D.A.Y."
+                title_step = int(min(1.0, (elapsed - 0.3) / 0.5) * 15)
+                
+                if self._title_text is None:
+                    try:
+                        from settings import get_ai_name
+                        self._title_text = get_ai_name()
+                    except:
+                        self._title_text = "F.R.I.D.A.Y."
+                    cv.itemconfig(ids['title_glow'], text=self._title_text)
+                    cv.itemconfig(ids['title'], text=self._title_text)
                 
                 # Glow effect
-                glow_color = f"#00{int(100 * title_alpha):02x}{int(150 * title_alpha):02x}"
-                self.canvas.create_text(cx, title_y, text=title_text,
-                    font=("Segoe UI", 38, "bold"), fill=glow_color)
-                self.canvas.create_text(cx, title_y, text=title_text,
-                    font=("Segoe UI", 38, "bold"), fill=self.PRIMARY)
+                if title_step != self._last_title_step:
+                    self._last_title_step = title_step
+                    cv.itemconfig(ids['title_glow'], fill=self._TITLE_FADE[title_step], state="normal")
+                    cv.itemconfig(ids['title'], state="normal")
             
             # Subtitle
             if elapsed > 0.6:
-                sub_alpha = min(1.0, (elapsed - 0.6) / 0.5)
-                sub_color = f"#{int(50 * sub_alpha):02x}{int(100 * sub_alpha):02x}{int(130 * sub_alpha):02x}"
-                self.canvas.create_text(cx, title_y + 45, text="AI Voice Assistant",
-                    font=("Segoe UI", 14), fill=sub_color)
-            
-            # Status panel
-            self._draw_status(w, h)
-            
-            # Corner accents
-            self._draw_frame(w, h)
+                sub_step = int(min(1.0, (elapsed - 0.6) / 0.5) * 15)
+                if sub_step != self._last_sub_step:
+                    self._last_sub_step = sub_step
+                    cv.itemconfig(ids['subtitle'], fill=self._SUB_FADE[sub_step], state="normal")
             
             self.frame += 1
-            self.root.after(16, self._render)  # ~60 FPS for smooth animation
+            self.root.after(self._frame_interval_ms, self._render)
             
         except tk.TclError:
             self.active = False
@@ -334,111 +521,121 @@ class LoadingScreen:
             logger.error(f"Render error: {e}")
             self.close()
     
+    def _scan_frame(self, phase, w, h):
+        """Return the baked scan-line background for a phase, building it once"""
+        img = self._scan_frames[phase]
+        if img is None:
+            sin = math.sin
+            colors = self._SCAN_COLORS
+            offset = phase * 2 * math.pi / self.SCAN_PHASES
+            # One 1-pixel-wide column, tiled across the width by a single put
+            column = tuple(
+                (colors[int(10 + 5 * sin(i * 0.05 + offset))] if i % 2 == 0 else self.BG,)
+                for i in range(h)
+            )
+            img = tk.PhotoImage(master=self.root, width=w, height=h)
+            img.put(column, to=(0, 0, w, h))
+            self._scan_frames[phase] = img
+        return img
+    
+    def _core_frame(self, index):
+        """Return the baked core glow sprite for a pulse step, building it once"""
+        img = self._core_frames[index]
+        if img is None:
+            pulse = 0.7 + 0.3 * index / (self.CORE_FRAMES - 1)
+            # Concentric discs, outermost first: (radius squared, color)
+            rings = []
+            for i in range(4):
+                r = int(20 * pulse) - i * 3
+                if r > 0:
+                    rings.append((r * r, self._CORE_COLORS[int((100 - i * 20) * pulse)]))
+            
+            c = 20
+            img = tk.PhotoImage(master=self.root, width=2 * c + 1, height=2 * c + 1)
+            outer = rings[0][0]
+            for dy in range(-c, c + 1):
+                row = []
+                x0 = None
+                for dx in range(-c, c + 1):
+                    d = dx * dx + dy * dy
+                    if d > outer:
+                        continue
+                    if x0 is None:
+                        x0 = dx
+                    color = rings[0][1]
+                    for r_sq, ring_color in rings[1:]:
+                        if d <= r_sq:
+                            color = ring_color
+                    row.append(color)
+                # Pixels outside the outer disc are never put, so stay transparent
+                if row:
+                    img.put((tuple(row),), to=(c + x0, c + dy))
+            self._core_frames[index] = img
+        return img
+    
     def _draw_reactor(self, cx, cy, elapsed):
-        """Draw arc reactor with smooth glow effect"""
-        # Outer glow
-        for i in range(3):
-            r = 70 + i * 5
-            alpha = 30 - i * 10
-            self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                outline=f"#00{alpha:02x}{alpha + 20:02x}", width=1)
-        
-        # Main rings with smooth rotation
-        self.canvas.create_oval(cx - 60, cy - 60, cx + 60, cy + 60, outline=self.SECONDARY, width=2)
-        self.canvas.create_oval(cx - 45, cy - 45, cx + 45, cy + 45, outline=self.PRIMARY, width=2)
+        """Move the arc reactor's rotating segments and pulse its core"""
+        # Local names skip the global + attribute lookups in the loops below
+        cos, sin, rad = math.cos, math.sin, math.radians
+        call, cvw = self._tkcall, self._cvw
+        ids = self._ids
         
         # Rotating segments - smooth
         angle_offset = elapsed * 45  # Slower rotation
-        for i in range(8):
-            angle = math.radians(angle_offset + i * 45)
-            x1, y1 = cx + 48 * math.cos(angle), cy + 48 * math.sin(angle)
-            x2, y2 = cx + 58 * math.cos(angle), cy + 58 * math.sin(angle)
-            self.canvas.create_line(x1, y1, x2, y2, fill=self.PRIMARY, width=2)
-        
-        for i in range(6):
-            angle = math.radians(-angle_offset * 0.7 + i * 60)
-            x1, y1 = cx + 25 * math.cos(angle), cy + 25 * math.sin(angle)
-            x2, y2 = cx + 35 * math.cos(angle), cy + 35 * math.sin(angle)
-            self.canvas.create_line(x1, y1, x2, y2, fill=self.ACCENT, width=2)
+        base = rad(angle_offset)
+        cb, sb = cos(base), sin(base)
+        for seg_id, (ca, sa) in zip(ids['seg8'], self._RING8):
+            c, s = ca * cb - sa * sb, sa * cb + ca * sb
+            call(cvw, 'coords', seg_id, cx + 48 * c, cy + 48 * s, cx + 58 * c, cy + 58 * s)
+        
+        base = rad(-angle_offset * 0.7)
+        cb, sb = cos(base), sin(base)
+        for seg_id, (ca, sa) in zip(ids['seg6'], self._RING6):
+            c, s = ca * cb - sa * sb, sa * cb + ca * sb
+            call(cvw, 'coords', seg_id, cx + 25 * c, cy + 25 * s, cx + 35 * c, cy + 35 * s)
         
         # Core with smooth pulse
-        pulse = 0.85 + 0.15 * math.sin(elapsed * 3)  # Slower, subtler pulse
-        for i in range(4):
-            r = int(20 * pulse) - i * 3
-            if r > 0:
-                alpha = int((100 - i * 20) * pulse)
-                self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                    fill=f"#00{alpha:02x}{min(255, alpha + 50):02x}", outline="")
-        
-        self.canvas.create_oval(cx - 6, cy - 6, cx + 6, cy + 6, fill=self.ACCENT, outline="")
+        pulse = 0.85 + 0.15 * sin(elapsed * 3)  # Slower, subtler pulse
+        index = int((pulse - 0.7) / 0.3 * (self.CORE_FRAMES - 1) + 0.5)
+        if index != self._core_index:
+            self._core_index = index
+            call(cvw, 'itemconfigure', ids['core'], '-image', self._core_frame(index))
     
     def _draw_status(self, w, h):
-        """Draw status panel with smooth styling"""
-        panel_y = h - 85
+        """Update status text and progress bar"""
+        cv = self.canvas
+        ids = self._ids
         panel_w = 400
         px = (w - panel_w) // 2
-        
-        # Status text
-        self.canvas.create_text(w // 2, panel_y, text=self.status_text,
-            font=("Segoe UI", 11), fill=self.TEXT)
-        
-        # Progress bar background with rounded ends
-        bar_y = panel_y + 25
+        bar_y = h - 85 + 25
         bar_h = 4
-        self.canvas.create_rectangle(px, bar_y, px + panel_w, bar_y + bar_h, 
-            fill=self.DIM, outline="")
+        
+        cv.itemconfig(ids['status_text'], text=self.status_text)
         
         # Progress fill with glow
         fill_w = int(panel_w * self.progress)
         if fill_w > 0:
-            # Glow
-            self.canvas.create_rectangle(px, bar_y - 1, px + fill_w, bar_y + bar_h + 1,
-                fill="#003355", outline="")
-            # Main bar
-            self.canvas.create_rectangle(px, bar_y, px + fill_w, bar_y + bar_h,
-                fill=self.PRIMARY, outline="")
+            cv.coords(ids['bar_glow'], px, bar_y - 1, px + fill_w, bar_y + bar_h + 1)
+            cv.coords(ids['bar_fg'], px, bar_y, px + fill_w, bar_y + bar_h)
+        # Glow and fill share a tag so one call shows or hides both
+        cv.itemconfig("bar_fill", state="normal" if fill_w > 0 else "hidden")
         
         # Percentage
-        self.canvas.create_text(px + panel_w + 35, bar_y + 2, text=f"{int(self.progress * 100)}%",
-            font=("Segoe UI", 10), fill=self.PRIMARY)
-        
-        # Bottom branding
-        self.canvas.create_text(w // 2, h - 25, text="F.R.I.D.A.Y. • AI ASSISTANT",
-            font=("Segoe UI", 9), fill=self.DIM)
+        cv.itemconfig(ids['percent_text'], text=f"{int(self.progress * 100)}%")
     
     def _draw_frame(self, w, h):
-        """Draw rounded corner accents"""
-        import math
+        """Draw rounded corner accents - one native arc item per corner"""
         radius = 20
         c = self.SECONDARY
-        
-        # Top-left rounded corner
-        for i in range(90):
-            angle = math.radians(180 + i)
-            x = 20 + radius + int(radius * math.cos(angle))
-            y = 20 + radius + int(radius * math.sin(angle))
-            self.canvas.create_oval(x-1, y-1, x+1, y+1, fill=c, outline=c)
-        
-        # Top-right rounded corner
-        for i in range(90):
-            angle = math.radians(270 + i)
-            x = w - 20 - radius + int(radius * math.cos(angle))
-            y = 20 + radius + int(radius * math.sin(angle))
-            self.canvas.create_oval(x-1, y-1, x+1, y+1, fill=c, outline=c)
-        
-        # Bottom-left rounded corner
-        for i in range(90):
-            angle = math.radians(90 + i)
-            x = 20 + radius + int(radius * math.cos(angle))
-            y = h - 20 - radius + int(radius * math.sin(angle))
-            self.canvas.create_oval(x-1, y-1, x+1, y+1, fill=c, outline=c)
-        
-        # Bottom-right rounded corner
-        for i in range(90):
-            angle = math.radians(i)
-            x = w - 20 - radius + int(radius * math.cos(angle))
-            y = h - 20 - radius + int(radius * math.sin(angle))
-            self.canvas.create_oval(x-1, y-1, x+1, y+1, fill=c, outline=c)
+        corners = (
+            (20 + radius, 20 + radius, 90),           # Top-left
+            (w - 20 - radius, 20 + radius, 0),        # Top-right
+            (20 + radius, h - 20 - radius, 180),      # Bottom-left
+            (w - 20 - radius, h - 20 - radius, 270),  # Bottom-right
+        )
+        for ox, oy, start in corners:
+            self.canvas.create_arc(ox - radius, oy - radius, ox + radius, oy + radius,
+                start=start, extent=90, style="arc", outline=c, width=2)
     
     def run(self):
         """Run the loading screen mainloop"""
@@ -452,30 +649,37 @@ gui = None
 recognizer = None
 tts = None
 is_listening = False
+shutdown_event = threading.Event()  # Set on exit to stop background loops
+
+
+# Typical wall time of the parallel module imports, used to pace the progress bar
+IMPORT_ESTIMATE_SECONDS = 3.0
 
 
 def initialize_app(loader: LoadingScreen):
-    """Initialize all app components in background"""
+    """Initialize all app components in background
+    
+    No cosmetic sleeps between steps - the loading screen already holds
+    for at least 2 seconds before closing.
+    """
     global gui, recognizer, tts, is_listening
     
     try:
         # Step 1: Load config
         loader.set_status("LOADING CONFIGURATION...", 0.1)
-        time.sleep(0.1)  # Minimal delay for visual feedback
         
         from config import WAKE_WORD, OPENAI_API_KEY
         logger.info("Config loaded")
         
         # Step 2: Load settings and apply API key
         loader.set_status("LOADING USER SETTINGS...", 0.2)
-        time.sleep(0.1)
         
         try:
             from settings import load_settings, apply_api_keys, get_ai_name
             settings = load_settings()
             
             # Apply API key from settings to environment
-            if apply_api_keys():
+            if apply_api_keys(settings):
                 logger.info("API key loaded from settings")
             else:
                 # Try from config as fallback
@@ -488,44 +692,46 @@ def initialize_app(loader: LoadingScreen):
         except Exception as e:
             logger.error(f"Settings error: {e}")
         
-        # Step 3: Initialize database
+        # Steps 3-6: database, AI core, commands and GUI only need the API
+        # keys applied above, so import them in parallel to overlap their I/O
         loader.set_status("CONNECTING DATABASE...", 0.3)
-        time.sleep(0.1)
-        
-        from database import db
-        logger.info("Database connected")
-        
-        # Step 4: Load AI module
-        loader.set_status("INITIALIZING AI CORE...", 0.45)
-        time.sleep(0.1)
-        
-        from ai_brain import brain
-        logger.info("AI brain loaded")
-        
-        # Step 5: Load commands
-        loader.set_status("LOADING COMMAND PROTOCOLS...", 0.55)
-        time.sleep(0.1)
-        
-        from commands import command_handler
-        logger.info("Commands loaded")
         
-        # Step 6: Skip speech init here - do it after GUI to avoid segfault
-        loader.set_status("PREPARING VOICE INTERFACE...", 0.7)
-        time.sleep(0.1)
-        
-        # Just import, don't init yet (PyAudio conflicts with CTK if inited first)
+        modules = {
+            "database": ("INITIALIZING AI CORE...", "Database connected"),
+            "ai_brain": ("LOADING COMMAND PROTOCOLS...", "AI brain loaded"),
+            "commands": ("PREPARING INTERFACE...", "Commands loaded"),
+            "gui": ("PREPARING INTERFACE...", "GUI module loaded"),
+        }
+        # Pause splash drawing while the imports run so they get the GIL
+        loader._draw_enabled.clear()
+        try:
+            with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+                futures = {pool.submit(importlib.import_module, name): name for name in modules}
+                pending = set(futures)
+                started = time.monotonic()
+                while pending:
+                    finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    status = None
+                    for future in finished:
+                        future.result()
+                        status, message = modules[futures[future]]
+                        logger.info(message)
+                
+                    # Progress follows wall-clock time between completions, but never
+                    # runs past the next module that is still loading
+                    completed = len(modules) - len(pending)
+                    timed = (time.monotonic() - started) / IMPORT_ESTIMATE_SECONDS
+                    fraction = max(completed, min(timed * len(modules), completed + 0.9)) / len(modules)
+                    loader.set_status(status, 0.3 + 0.55 * min(1.0, fraction))
+        finally:
+            loader._draw_enabled.set()
+        
+        # Speech is only imported here - init happens after the GUI
+        # (PyAudio conflicts with CTK if inited first)
         logger.info("Speech module ready (will init after GUI)")
         
-        # Step 7: Prepare GUI
-        loader.set_status("PREPARING INTERFACE...", 0.85)
-        time.sleep(0.1)
-        
-        from gui import ModernGUI
-        logger.info("GUI module loaded")
-        
         # Step 8: Final
         loader.set_status("SYSTEM READY", 1.0)
-        time.sleep(0.2)
         
         # Signal ready
         loader.set_ready()
@@ -650,7 +856,7 @@ def main():
             
             # Start speaking IMMEDIATELY in background
             if tts:
-                threading.Thread(target=tts.speak, args=(response,), daemon=True).start()
+                tts.speak_async(response)
             
             # Return response - GUI will type it word-by-word
             # The typing speed is synced to match speech
@@ -662,6 +868,11 @@ def main():
                 tts.stop()
             gui.set_action("Stopped", "⏹")
         
+        def settings_saved():
+            """Pick up a changed voice without restarting"""
+            if tts:
+                tts.refresh_voice()
+        
         def toggle_microphone():
             """Toggle microphone"""
             global is_listening
@@ -680,34 +891,48 @@ def main():
             else:
                 gui.add_assistant_message("Voice systems offline.")
         
+        last_hotkey = 0.0
+        
         def wake_from_hotkey():
             """Wake via hotkey"""
+            nonlocal last_hotkey
+            # Ignore key repeat / double presses within 500ms
+            now = time.monotonic()
+            if now - last_hotkey < 0.5:
+                return
+            last_hotkey = now
+            
             if recognizer:
                 recognizer.wake_up()
             gui.set_awake(True)
             gui.add_assistant_message("Yes? What do you need?")
             if tts:
-                threading.Thread(target=tts.speak, args=("Yes?",), daemon=True).start()
+                tts.speak_async("Yes?")
         
         # Create GUI FIRST (before speech to avoid PyAudio/CTK conflict)
         gui = ModernGUI(
             on_text_command=process_text_command,
             on_mic_toggle=toggle_microphone,
-            on_stop_speaking=stop_speaking
+            on_stop_speaking=stop_speaking,
+            on_settings_saved=settings_saved
         )
         
         command_handler.set_gui_callback(gui.add_assistant_message)
         
-        # NOW initialize speech (after GUI is created)
-        logger.info("Initializing speech systems...")
-        from speech import init_speech
-        recognizer, tts = init_speech()
-        logger.info("Speech systems ready")
-        
         # Start voice recognition
         def start_voice():
-            global is_listening
-            time.sleep(1.0)  # Let GUI fully initialize
+            global is_listening, recognizer, tts
+            
+            # Initialize speech here (after GUI is created) so the window
+            # is usable while PyAudio probes the audio devices
+            logger.info("Initializing speech systems...")
+            gui.set_status("Initializing voice...")
+            from speech import init_speech
+            recognizer, tts = init_speech()
+            logger.info("Speech systems ready")
+            gui.set_status("Ready")
+            
+            gui.ready_evt.wait(timeout=5.0)  # Mainloop is up and processing events
             
             # Get AI name for messages
             try:
@@ -740,12 +965,15 @@ def main():
         
         threading.Thread(target=start_voice, daemon=True).start()
         
-        # Setup hotkey
-        setup_hotkey(wake_from_hotkey)
+        # Setup hotkey - keyboard probes input devices, keep it off the main path
+        threading.Thread(target=setup_hotkey, args=(wake_from_hotkey,), daemon=True).start()
         
         # Reminder checker
         def check_reminders():
-            while True:
+            while not shutdown_event.is_set():
+                # Clear before querying so a reminder added meanwhile wakes us
+                db.reminders_changed.clear()
+                timeout = 3600
                 try:
                     reminders = db.get_pending_reminders()
                     for reminder in reminders:
@@ -753,9 +981,15 @@ def main():
                         if tts:
                             tts.speak(f"Reminder: {reminder['message']}")
                         db.mark_reminder_complete(reminder['id'])
-                except:
-                    pass
-                time.sleep(60)
+                    
+                    # Sleep until the next reminder is due instead of polling
+                    next_due = db.seconds_until_next_reminder()
+                    if next_due is not None:
+                        timeout = min(timeout, max(1.0, next_due))
+                except Exception as e:
+                    logger.error(f"Reminder check error: {e}")
+                    timeout = 60
+                db.reminders_changed.wait(timeout=timeout)
         
         threading.Thread(target=check_reminders, daemon=True).start()
         
@@ -769,6 +1003,10 @@ def main():
         sys.exit(1)
     
     finally:
+        # Wake background loops so they exit instead of dying mid-wait
+        shutdown_event.set()
+        db.reminders_changed.set()
+        
         # Stop all audio and cleanup
         if tts:
             tts.shutdown()
@@ -21,14 +21,18 @@ def test_pyaudio():
         input_devices = []
         output_devices = []
         
-        for i in range(p.get_device_count()):
-            dev = p.get_device_info_by_index(i)
-            if dev['maxInputChannels'] > 0:
-                input_devices.append((i, dev['name']))
-                print(f"  [INPUT  {i}] {dev['name']}")
-            if dev['maxOutputChannels'] > 0:
-                output_devices.append((i, dev['name']))
-                print(f"  [OUTPUT {i}] {dev['name']}")
+        # Walk devices per host API - avoids a global index lookup per device
+        for api_idx in range(p.get_host_api_count()):
+            api = p.get_host_api_info_by_index(api_idx)
+            for j in range(api['deviceCount']):
+                dev = p.get_device_info_by_host_api_device_index(api_idx, j)
+                i = dev['index']
+                if dev['maxInputChannels'] > 0:
+                    input_devices.append((i, dev['name']))
+                    print(f"  [INPUT  {i}] {dev['name']}")
+                if dev['maxOutputChannels'] > 0:
+                    output_devices.append((i, dev['name']))
+                    print(f"  [OUTPUT {i}] {dev['name']}")
         
         p.terminate()
         
@@ -6,19 +6,27 @@ stable_v1.2.0 - Multi-AI Edition (Ollama, Gemini, ChatGPT)
 """
 
 import json
+import logging
 import os
 import math
+import platform
+import sys
 import wave
-import struct
+from array import array
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 # Settings file location
 SETTINGS_DIR = Path.home() / "friday-assistant"
 SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 ALARM_SOUND_FILE = SETTINGS_DIR / "alarm.wav"
 MEMORY_FILE = SETTINGS_DIR / "user_memory.json"
 
+# Resolved once - the OS doesn't change while we're running
+_SYSTEM = platform.system()
+
 # Voice option - F.R.I.D.A.Y. only
 VOICE_OPTIONS = {
     "F.R.I.D.A.Y. (Irish Female)": "en-IE-EmilyNeural",
@@ -35,6 +43,11 @@ AI_PROVIDER_OPTIONS = {
     "gemini": "🆓 Gemini 1.5 Flash - FREE Unlimited",
     "openai": "💰 ChatGPT 4o-mini - Paid"
 }
+AI_PROVIDER_REVERSE = {v: k for k, v in AI_PROVIDER_OPTIONS.items()}
+
+# Language options shown in the settings dialog
+LANGUAGE_OPTIONS = {"en": "English", "ru": "Русский", "auto": "Auto-detect"}
+LANGUAGE_REVERSE = {v: k for k, v in LANGUAGE_OPTIONS.items()}
 
 # Default settings
 DEFAULT_SETTINGS = {
@@ -54,51 +67,104 @@ DEFAULT_SETTINGS = {
 }
 
 
+# Set once SETTINGS_DIR is known to exist
+_DIR_READY = False
+
+
+def _ensure_dir():
+    """Create SETTINGS_DIR on first use - later calls are a flag check"""
+    global _DIR_READY
+    if not _DIR_READY:
+        SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+        _DIR_READY = True
+
+
+# Last parsed settings and the file mtime they were read at
+_SETTINGS_CACHE = {"mtime": None, "data": None}
+
+
+def _cache_settings(mtime, settings: dict):
+    """Remember parsed settings (with defaults filled in) for this mtime"""
+    data = {**DEFAULT_SETTINGS, **settings}
+    _SETTINGS_CACHE["mtime"] = mtime
+    _SETTINGS_CACHE["data"] = data
+    return data
+
+
 def load_settings() -> dict:
-    """Load settings from file"""
-    SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+    """Load settings from file
+    
+    The file is only re-read when its mtime changes. Callers get their
+    own copy, so they can modify and save it freely.
+    """
+    # A missing file (or settings dir) just means defaults - the stat
+    # doubles as the existence check, and only saving creates the dir
+    try:
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
     
-    if SETTINGS_FILE.exists():
+    if mtime is not None:
+        if mtime == _SETTINGS_CACHE["mtime"]:
+            return _SETTINGS_CACHE["data"].copy()
         try:
             with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
-                for key, value in DEFAULT_SETTINGS.items():
-                    if key not in settings:
-                        settings[key] = value
-                return settings
+                return _cache_settings(mtime, json.load(f)).copy()
         except Exception as e:
-            print(f"[!] Error loading settings: {e}")
+            logger.error(f"Error loading settings: {e}")
     
     return DEFAULT_SETTINGS.copy()
 
 
+def _write_json(path: Path, data: dict):
+    """Serialize in memory, write once to a temp file, then swap it in
+    
+    A crash mid-save can't leave a truncated file behind.
+    """
+    text = json.dumps(data, indent=2)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
 def save_settings(settings: dict):
     """Save settings to file"""
-    SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir()
     
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
-        print("[OK] Configuration saved")
+        _write_json(SETTINGS_FILE, settings)
+        # Saved values are already parsed - no need to re-read them
+        _cache_settings(os.stat(SETTINGS_FILE).st_mtime_ns, settings)
+        logger.info("Configuration saved")
     except Exception as e:
-        print(f"[!] Error saving settings: {e}")
+        logger.error(f"Error saving settings: {e}")
+    
+    # Translated text may embed the AI name and wake word
+    try:
+        from translations import invalidate_translation_cache
+        invalidate_translation_cache()
+    except ImportError:
+        pass
+
+
+# Environment variable name -> settings key
+_KEY_MAP = {
+    "OPENAI_API_KEY": "openai_api_key",
+    "GOOGLE_API_KEY": "google_api_key",
+    "OPENWEATHER_API_KEY": "openweather_api_key",
+}
 
 
 def get_api_key(key_name: str) -> str:
     """Get API key from settings or environment"""
-    env_key = os.environ.get(key_name.upper(), "")
+    env_name = key_name.upper()
+    env_key = os.environ.get(env_name, "")
     if env_key and not env_key.startswith("YOUR_"):
         return env_key
     
-    settings = load_settings()
-    key_map = {
-        "OPENAI_API_KEY": "openai_api_key",
-        "GOOGLE_API_KEY": "google_api_key", 
-        "OPENWEATHER_API_KEY": "openweather_api_key",
-    }
-    
-    settings_key = key_map.get(key_name.upper(), key_name.lower())
-    return settings.get(settings_key, "")
+    settings_key = _KEY_MAP.get(env_name, key_name.lower())
+    return load_settings().get(settings_key, "")
 
 
 def get_voice_id() -> str:
@@ -121,25 +187,29 @@ def get_wake_word() -> str:
     return settings.get("wake_word", "friday")
 
 
-def apply_api_keys():
-    """Apply API keys from settings to environment"""
-    settings = load_settings()
+def apply_api_keys(settings: Optional[dict] = None):
+    """Apply API keys from settings to environment
+    
+    Pass an already loaded settings dict to skip loading it again.
+    """
+    if settings is None:
+        settings = load_settings()
     
     api_key = settings.get("openai_api_key", "")
     if api_key and api_key.startswith("sk-"):
-        os.environ["OPENAI_API_KEY"] = api_key
+        if os.environ.get("OPENAI_API_KEY") != api_key:
+            os.environ["OPENAI_API_KEY"] = api_key
         return True
     return False
 
 
 def load_user_memory() -> dict:
     """Load user memory/preferences"""
-    if MEMORY_FILE.exists():
-        try:
-            with open(MEMORY_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+    try:
+        with open(MEMORY_FILE, 'r') as f:
+            return json.load(f)
+    except:
+        pass  # Missing or unreadable - start with empty memory
     return {
         "user_name": None,
         "preferences": {},
@@ -149,12 +219,25 @@ def load_user_memory() -> dict:
 
 def save_user_memory(memory: dict):
     """Save user memory"""
-    SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir()
     try:
-        with open(MEMORY_FILE, 'w') as f:
-            json.dump(memory, f, indent=2)
+        _write_json(MEMORY_FILE, memory)
     except Exception as e:
-        print(f"[!] Error saving memory: {e}")
+        logger.error(f"Error saving memory: {e}")
+
+
+# Withdrawn Tk root for the plain-tkinter prompt - created once, on first use
+_HIDDEN_ROOT = None
+
+
+def _get_hidden_root():
+    """Return the shared hidden Tk root, creating it the first time"""
+    global _HIDDEN_ROOT
+    if _HIDDEN_ROOT is None:
+        import tkinter as tk
+        _HIDDEN_ROOT = tk.Tk()
+        _HIDDEN_ROOT.withdraw()
+    return _HIDDEN_ROOT
 
 
 def show_settings_dialog(parent=None) -> bool:
@@ -165,15 +248,15 @@ def show_settings_dialog(parent=None) -> bool:
         def get_text(k, l="en", **kw):
             return k
     
+    # Shared by both dialog variants and their button callbacks
+    from tkinter import messagebox
+    
     try:
         import customtkinter as ctk
     except ImportError:
-        import tkinter as tk
-        from tkinter import simpledialog, messagebox
+        from tkinter import simpledialog
         
-        root = tk.Tk() if parent is None else parent
-        if parent is None:
-            root.withdraw()
+        root = parent if parent is not None else _get_hidden_root()
         
         api_key = simpledialog.askstring(
             "F.R.I.D.A.Y. Setup",
@@ -237,7 +320,6 @@ def show_settings_dialog(parent=None) -> bool:
     ctk.CTkLabel(ai_frame, text="Select AI Provider:", font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w", padx=10, pady=(8, 3))
     
     # Provider selection
-    provider_map = {v: k for k, v in AI_PROVIDER_OPTIONS.items()}
     current_provider = settings.get("ai_provider", "offline")
     provider_display = AI_PROVIDER_OPTIONS.get(current_provider, AI_PROVIDER_OPTIONS["offline"])
     provider_var = ctk.StringVar(value=provider_display)
@@ -311,11 +393,10 @@ def show_settings_dialog(parent=None) -> bool:
     
     # Language
     ctk.CTkLabel(voice_frame, text="Language:", font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10, pady=(8, 3))
-    lang_map = {"en": "English", "ru": "Русский", "auto": "Auto-detect"}
-    lang_var = ctk.StringVar(value=lang_map.get(settings.get("language", "en"), "English"))
+    lang_var = ctk.StringVar(value=LANGUAGE_OPTIONS.get(settings.get("language", "en"), "English"))
     lang_menu = ctk.CTkOptionMenu(
         voice_frame,
-        values=["English", "Русский", "Auto-detect"],
+        values=list(LANGUAGE_OPTIONS.values()),
         variable=lang_var,
         width=200
     )
@@ -356,8 +437,6 @@ def show_settings_dialog(parent=None) -> bool:
         """Delete all user data for clean start"""
         import shutil
         import gc
-        import sqlite3
-        from tkinter import messagebox
         
         confirm = messagebox.askyesno(
             "Reset All Data",
@@ -370,32 +449,22 @@ def show_settings_dialog(parent=None) -> bool:
                 # Force garbage collection to release any open connections
                 gc.collect()
                 
-                # Close any SQLite connections
-                try:
-                    sqlite3.connect(':memory:').execute('PRAGMA optimize').close()
-                except:
-                    pass
-                
                 # Delete individual files first (more reliable than rmtree on Windows)
                 db_path = SETTINGS_DIR / "friday_data.db"
-                if db_path.exists():
-                    try:
-                        db_path.unlink()
-                    except PermissionError:
-                        # If still locked, mark for deletion on restart
-                        pass
+                try:
+                    db_path.unlink(missing_ok=True)
+                except PermissionError:
+                    # If still locked, mark for deletion on restart
+                    pass
                 
                 # Delete settings file
-                if SETTINGS_FILE.exists():
-                    SETTINGS_FILE.unlink()
+                SETTINGS_FILE.unlink(missing_ok=True)
                 
                 # Delete memory file
-                if MEMORY_FILE.exists():
-                    MEMORY_FILE.unlink()
+                MEMORY_FILE.unlink(missing_ok=True)
                 
                 # Delete alarm file
-                if ALARM_SOUND_FILE.exists():
-                    ALARM_SOUND_FILE.unlink()
+                ALARM_SOUND_FILE.unlink(missing_ok=True)
                 
                 # Delete temp audio files
                 import tempfile
@@ -410,7 +479,6 @@ def show_settings_dialog(parent=None) -> bool:
                 dialog.destroy()
                 
                 # Force exit
-                import os
                 os._exit(0)
                 
             except Exception as e:
@@ -450,11 +518,9 @@ def show_settings_dialog(parent=None) -> bool:
         except:
             timeout = 30
         
-        lang_reverse = {"English": "en", "Русский": "ru", "Auto-detect": "auto"}
-        
         # Get selected AI provider
         selected_provider_display = provider_var.get()
-        selected_provider = provider_map.get(selected_provider_display, "offline")
+        selected_provider = AI_PROVIDER_REVERSE.get(selected_provider_display, "offline")
         
         # Save settings
         settings["ai_provider"] = selected_provider
@@ -464,22 +530,20 @@ def show_settings_dialog(parent=None) -> bool:
         settings["voice"] = "F.R.I.D.A.Y. (Irish Female)"
         settings["ai_name"] = "F.R.I.D.A.Y."
         settings["wake_word"] = wake_entry.get().strip().lower() or "friday"
-        settings["language"] = lang_reverse.get(lang_var.get(), "en")
+        settings["language"] = LANGUAGE_REVERSE.get(lang_var.get(), "en")
         settings["conversation_timeout"] = timeout
         settings["minimize_to_tray"] = tray_var.get()
         settings["notifications_enabled"] = notif_var.get()
         
-        # Apply keys to environment
-        if gemini_key:
+        # Apply keys to environment (both were validated above)
+        if gemini_key and os.environ.get("GOOGLE_API_KEY") != gemini_key:
             os.environ["GOOGLE_API_KEY"] = gemini_key
-        if openai_key:
-            os.environ["OPENAI_API_KEY"] = openai_key
+        apply_api_keys(settings)
         
         save_settings(settings)
         result["saved"] = True
         
         # Show success and suggest restart
-        from tkinter import messagebox
         restart = messagebox.askyesno(
             "Settings Saved",
             "Settings saved successfully!\n\nRestart F.R.I.D.A.Y. now to apply changes?",
@@ -575,7 +639,7 @@ del "%~f0"
         # Exit current instance
         os._exit(0)
     except Exception as e:
-        print(f"Restart failed: {e}")
+        logger.error(f"Restart failed: {e}")
         # Try simple exit if restart fails
         try:
             os._exit(0)
@@ -589,65 +653,116 @@ def needs_setup() -> bool:
     return not api_key or api_key.startswith("YOUR_") or len(api_key) < 20
 
 
+# Path of the alarm WAV once it is known to exist
+_ALARM_PATH_CACHED: Optional[str] = None
+
+
 def generate_alarm_sound():
     """Generate a pleasant alarm sound WAV file"""
-    SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+    global _ALARM_PATH_CACHED
+    if _ALARM_PATH_CACHED:
+        return _ALARM_PATH_CACHED
+    
+    _ensure_dir()
     
     if ALARM_SOUND_FILE.exists():
-        return str(ALARM_SOUND_FILE)
+        _ALARM_PATH_CACHED = str(ALARM_SOUND_FILE)
+        return _ALARM_PATH_CACHED
     
     try:
         sample_rate = 44100
         duration = 1.5
         frequencies = [523.25, 659.25, 783.99]
         
-        samples = []
         num_samples = int(sample_rate * duration)
         
-        for i in range(num_samples):
-            t = i / sample_rate
-            envelope = math.exp(-t * 2)
+        # NumPy is optional - when present the whole buffer is computed at once
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        
+        if np is not None:
+            t = np.arange(num_samples) / sample_rate
+            sample = np.sin(2 * np.pi * np.array(frequencies)[:, None] * t).sum(axis=0) * np.exp(-t * 2)
             
-            sample = 0
-            for freq in frequencies:
-                sample += math.sin(2 * math.pi * freq * t) * envelope
+            late = t > 0.5
+            t2 = t[late] - 0.5
+            sample[late] += np.sin(2 * np.pi * np.array([587.33, 739.99, 880.00])[:, None] * t2).sum(axis=0) * np.exp(-t2 * 2)
             
-            if t > 0.5:
-                t2 = t - 0.5
-                envelope2 = math.exp(-t2 * 2)
-                for freq in [587.33, 739.99, 880.00]:
-                    sample += math.sin(2 * math.pi * freq * t2) * envelope2
+            np.clip(sample / 6, -1, 1, out=sample)
+            frames = (sample * 32767).astype('<i2').tobytes()
+        else:
+            # Angular frequencies and math functions hoisted out of the loop
+            w1, w2, w3 = [2 * math.pi * freq for freq in frequencies]
+            w4, w5, w6 = [2 * math.pi * freq for freq in (587.33, 739.99, 880.00)]
+            sin, exp = math.sin, math.exp
             
-            sample = sample / 6
-            sample = max(-1, min(1, sample))
-            samples.append(int(sample * 32767))
+            # Packed int16 buffer - no Python int object kept per sample
+            samples = array('h', bytes(2 * num_samples))
+            for i in range(num_samples):
+                t = i / sample_rate
+                envelope = exp(-t * 2)
+                sample = sin(w1 * t) * envelope + sin(w2 * t) * envelope + sin(w3 * t) * envelope
+                
+                if t > 0.5:
+                    t2 = t - 0.5
+                    envelope2 = exp(-t2 * 2)
+                    sample += sin(w4 * t2) * envelope2 + sin(w5 * t2) * envelope2 + sin(w6 * t2) * envelope2
+                
+                sample = sample / 6
+                sample = max(-1, min(1, sample))
+                samples[i] = int(sample * 32767)
+            if sys.byteorder == 'big':
+                samples.byteswap()  # WAV data is little-endian
+            frames = samples.tobytes()
         
         with wave.open(str(ALARM_SOUND_FILE), 'w') as wav_file:
             wav_file.setnchannels(1)
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
-            
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
+            wav_file.writeframes(frames)
         
-        return str(ALARM_SOUND_FILE)
+        _ALARM_PATH_CACHED = str(ALARM_SOUND_FILE)
+        return _ALARM_PATH_CACHED
         
     except Exception as e:
-        print(f"[!] Could not generate alarm sound: {e}")
+        logger.error(f"Could not generate alarm sound: {e}")
         return None
 
 
+# Player command for alarms on Linux/macOS - [] if none is installed
+_ALARM_CMD = None
+
+
+def _alarm_command() -> list:
+    """Find the first installed audio player once, instead of trying each per alarm"""
+    global _ALARM_CMD
+    if _ALARM_CMD is None:
+        import shutil
+        players = (
+            ("mpv", ["--no-video", "--really-quiet"]),
+            ("ffplay", ["-nodisp", "-autoexit"]),
+            ("paplay", []),
+            ("aplay", []),
+        )
+        _ALARM_CMD = []
+        for player, args in players:
+            path = shutil.which(player)
+            if path:
+                _ALARM_CMD = [path] + args
+                break
+    return _ALARM_CMD
+
+
 def play_alarm_sound():
     """Play the alarm sound"""
     sound_file = generate_alarm_sound()
     if not sound_file:
         return
     
-    import platform
-    system = platform.system()
-    
     try:
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             try:
                 import pygame
                 pygame.mixer.init()
@@ -661,37 +776,33 @@ def play_alarm_sound():
                 winsound.PlaySound(sound_file, winsound.SND_FILENAME)
         else:
             import subprocess
-            for player in ["mpv", "ffplay", "paplay", "aplay"]:
+            cmd = _alarm_command()
+            if cmd:
                 try:
-                    if player == "mpv":
-                        subprocess.run([player, "--no-video", "--really-quiet", sound_file], 
-                                      capture_output=True, timeout=5)
-                    elif player == "ffplay":
-                        subprocess.run([player, "-nodisp", "-autoexit", sound_file],
-                                      capture_output=True, timeout=5)
-                    else:
-                        subprocess.run([player, sound_file], capture_output=True, timeout=5)
-                    break
-                except:
-                    continue
+                    subprocess.run(cmd + [sound_file], capture_output=True, timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
     except Exception as e:
-        print(f"[!] Could not play alarm: {e}")
+        logger.error(f"Could not play alarm: {e}")
+
+
+# win10toast notifier, created on the first Windows notification
+_TOASTER = None
 
 
 def send_notification(title: str, message: str):
     """Send a desktop notification"""
-    import platform
-    system = platform.system()
-    
+    global _TOASTER
     try:
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             try:
-                from win10toast import ToastNotifier
-                toaster = ToastNotifier()
-                toaster.show_toast(title, message, duration=5, threaded=True)
+                if _TOASTER is None:
+                    from win10toast import ToastNotifier
+                    _TOASTER = ToastNotifier()
+                _TOASTER.show_toast(title, message, duration=5, threaded=True)
             except:
                 pass
-        elif system == "Darwin":
+        elif _SYSTEM == "Darwin":
             import subprocess
             subprocess.run([
                 "osascript", "-e",
@@ -701,4 +812,4 @@ def send_notification(title: str, message: str):
             import subprocess
             subprocess.run(["notify-send", title, message], capture_output=True)
     except Exception as e:
-        print(f"[!] Notification error: {e}")
+        logger.error(f"Notification error: {e}")
@@ -6,15 +6,20 @@ Optimized for Pop!_OS with PipeWire
 """
 
 # Standard library imports
+import functools
+import hashlib
+import itertools
 import os
 import queue
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
 import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Callable, Optional
@@ -54,12 +59,6 @@ except ImportError:
     SR_AVAILABLE = False
     print("Warning: speech_recognition not available")
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
 try:
     import edge_tts
     import asyncio
@@ -95,6 +94,70 @@ LANGUAGE_CODES = {
     "auto": None,  # Will try multiple languages
 }
 
+# Synthesized phrases kept in the temp dir for replay - the least recently
+# used are trimmed at startup and again after every few new phrases
+TTS_CACHE_MAX_FILES = 200
+TTS_CACHE_TRIM_EVERY = 20
+
+# Microphone capture format - 10ms reads at 16kHz let listen() notice speech
+# and end-of-speech sooner than the default 1024-frame chunks, for a few more
+# (cheap) read calls per second. Devices that refuse 16kHz use their own rate
+MIC_SAMPLE_RATE = 16000
+MIC_READS_PER_SECOND = 100
+
+# How often the open microphone re-measures background noise
+AMBIENT_RECHECK_SECONDS = 60
+
+# Input device name keywords - direct ALSA hardware devices conflict with
+# PipeWire; PipeWire/Pulse/default devices are preferred, then headsets
+_HW_DEVICE_KEYWORDS = ("hw:",)
+_PREFERRED_DEVICE_KEYWORDS = ("pipewire", "pulse", "default")
+_HEADSET_DEVICE_KEYWORDS = ("arctis",)
+
+# Sentence boundaries for pipelining long replies through TTS
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Text checks and clean-up run on every utterance - compile them once
+_CYRILLIC_RE = re.compile(r'[\u0400-\u04FF]')
+# URLs, bullet points, ellipses and markdown symbols in one scan - markdown
+# may sit inside an ellipsis or before a bullet, as if it were removed first
+_CLEAN_RE = re.compile(
+    r'https?://\S+'
+    r'|^[*_~`]*[\-•▪►]\s*'
+    r'|(?P<ellipsis>\.(?:[*_~`]*\.)+)'
+    r'|[*_~`]',
+    re.MULTILINE,
+)
+# Any of these means _CLEAN_RE might match - plain text skips it entirely
+_CLEAN_TRIGGERS = ("http", "..", "*", "_", "~", "`", "-", "•", "▪", "►")
+# Whisper punctuates its transcripts - Google's (and our phrase matching) don't
+_PUNCT_RE = re.compile(r"[^\w\s']")
+
+
+def _clean_match(match) -> str:
+    """Replacement for a _CLEAN_RE match"""
+    return "." if match.lastgroup == "ellipsis" else ""
+
+
+# Unique suffixes for in-flight synthesis files (pipelined sentences and
+# back-to-back replies can land in the same second)
+_TMP_AUDIO_IDS = itertools.count()
+
+# Persistent workers for the parallel English/Russian Google requests
+_GOOGLE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Farewells that put the assistant to sleep, matched in one search:
+# "thanks"-style phrases only count at the start of a short (< 30 chars)
+# message ("thanks, ..."), the others anywhere in a sentence
+_SLEEP_RE = re.compile(
+    r'^(?=.{0,29}\Z)(?:thanks|thank you|bye|спасибо)(?:\Z|[ ,])|'
+    + "|".join(map(re.escape, [
+        "goodbye", "go to sleep", "that's all", "bye bye", "see you", "goodnight",
+        "stop listening", "nevermind", "never mind", "пока", "до свидания",
+    ])),
+    re.DOTALL,
+)
+
 # Edge TTS voices - Irish female is default (like Kerry Condon as F.R.I.D.A.Y.)
 EDGE_TTS_VOICES = {
     "en": "en-IE-EmilyNeural",      # Irish female - F.R.I.D.A.Y. voice!
@@ -124,8 +187,9 @@ def check_pipewire_status():
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def find_audio_player():
-    """Find available audio player on the system"""
+    """Find available audio player on the system (probed once per process)"""
     import platform
     system = platform.system()
     
@@ -153,13 +217,9 @@ def find_audio_player():
     ]
     
     for name, cmd in players:
-        try:
-            result = subprocess.run(["which", name], capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"[OK] Audio player: {name}")
-                return cmd
-        except:
-            continue
+        if shutil.which(name):
+            print(f"[OK] Audio player: {name}")
+            return cmd
     
     print("[!] No audio player found - install mpv: sudo apt install mpv")
     return None
@@ -177,6 +237,7 @@ class SmartSpeechRecognizer:
         
         self.recognizer = sr.Recognizer()
         self.device_index = None
+        self._mic_sample_rate = MIC_SAMPLE_RATE  # Device default once 16kHz is refused
         self.is_listening = False
         self.is_awake = False
         self.callback = None
@@ -190,13 +251,28 @@ class SmartSpeechRecognizer:
             self.wake_word = WAKE_WORD.lower()
         
         self.wake_words = [self.wake_word] + [w.lower() for w in WAKE_WORDS if w.lower() != self.wake_word]
+        # One compiled scan finds the first wake word and where the command starts
+        self._wake_re = re.compile("|".join(map(re.escape, self.wake_words)))
         self.last_interaction = 0  # For conversation mode
         
-        self.recognizer.pause_threshold = PAUSE_THRESHOLD
-        self.recognizer.non_speaking_duration = 0.5
+        self.recognizer.pause_threshold = max(PAUSE_THRESHOLD, 0.4)
+        self.recognizer.non_speaking_duration = 0.3
         self.recognizer.dynamic_energy_threshold = False  # We'll set it manually
         self.recognizer.energy_threshold = 150  # Lower = more sensitive
-        self.recognizer.phrase_threshold = 0.1
+        self.recognizer.phrase_threshold = 0.05
+        
+        # Local Whisper model if installed - no network round trip per phrase.
+        # The multilingual model also covers "auto" (English/Russian) in one pass
+        self._whisper = None
+        try:
+            from faster_whisper import WhisperModel
+            model_name = "tiny.en" if SPEECH_LANGUAGE == "en" else "tiny"
+            self._whisper = WhisperModel(model_name, device="auto", compute_type="int8")
+            print(f"[OK] Local speech recognition: whisper {model_name}")
+        except ImportError:
+            pass  # Not installed - Google recognition only
+        except Exception as e:
+            print(f"[!] Whisper unavailable, using Google: {e}")
         
         check_pipewire_status()
         self._init_microphone()
@@ -229,15 +305,15 @@ class SmartSpeechRecognizer:
                             input_devices.append((i, name, max_input))
                             
                             # Skip direct hardware devices - they conflict with PipeWire
-                            is_hw = 'hw:' in name
-                            is_arctis = 'arctis' in name.lower()
-                            is_pipewire = 'pipewire' in name.lower() or 'pulse' in name.lower()
-                            is_default = 'default' in name.lower()
+                            lname = name.lower()
+                            is_hw = any(k in name for k in _HW_DEVICE_KEYWORDS)
+                            is_arctis = any(k in lname for k in _HEADSET_DEVICE_KEYWORDS)
+                            is_preferred = any(k in lname for k in _PREFERRED_DEVICE_KEYWORDS)
                             
                             marker = ""
                             if is_hw:
                                 marker = " (hardware - skipping)"
-                            elif is_pipewire or is_default:
+                            elif is_preferred:
                                 pipewire_devices.append((i, name))
                                 marker = " <-- RECOMMENDED"
                             elif is_arctis:
@@ -269,7 +345,7 @@ class SmartSpeechRecognizer:
                 else:
                     # Find first non-hardware device
                     for idx, name, _ in input_devices:
-                        if 'hw:' not in name:
+                        if not any(k in name for k in _HW_DEVICE_KEYWORDS):
                             self.device_index = idx
                             device_name = name
                             print(f"[OK] Using device [{self.device_index}]: {device_name}")
@@ -282,7 +358,7 @@ class SmartSpeechRecognizer:
                 # Test microphone
                 print("Testing microphone...")
                 try:
-                    with sr.Microphone(device_index=self.device_index) as source:
+                    with self._open_microphone() as source:
                         # Quick calibration
                         self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                         threshold = self.recognizer.energy_threshold
@@ -304,6 +380,32 @@ class SmartSpeechRecognizer:
                 print(f"[ERROR] Microphone init failed: {type(e).__name__}: {e}")
                 self.device_index = None
     
+    def _new_microphone(self, sample_rate: int):
+        """Microphone on the selected device with small low-latency reads"""
+        return sr.Microphone(device_index=self.device_index, sample_rate=sample_rate,
+                             chunk_size=sample_rate // MIC_READS_PER_SECOND)
+    
+    @contextmanager
+    def _open_microphone(self):
+        """Open the selected microphone, falling back to its default rate"""
+        microphone = self._new_microphone(self._mic_sample_rate)
+        try:
+            source = microphone.__enter__()
+        except OSError:
+            # Raw hw: devices often only take 44.1/48kHz ("Invalid sample rate")
+            if self._mic_sample_rate != MIC_SAMPLE_RATE:
+                raise
+            default_rate = sr.Microphone(device_index=self.device_index).SAMPLE_RATE
+            if default_rate == MIC_SAMPLE_RATE:
+                raise
+            microphone = self._new_microphone(default_rate)
+            source = microphone.__enter__()
+            self._mic_sample_rate = default_rate  # Only once it actually opened
+        try:
+            yield source
+        finally:
+            microphone.__exit__(None, None, None)
+    
     def start_listening(self, callback: Callable[[str], None]):
         """Start continuous background listening"""
         if self.device_index is None:
@@ -337,34 +439,58 @@ class SmartSpeechRecognizer:
         except:
             pass
         
+        def close_microphone():
+            nonlocal microphone, source
+            if microphone is not None:
+                try:
+                    microphone.__exit__(None, None, None)
+                except Exception:
+                    pass
+            microphone = source = None
+        
+        source = None
+        last_calibration = 0.0
+        
         while self.is_listening:
             with suppress_alsa_errors():
                 try:
-                    # Create microphone instance fresh each time to avoid stale handles
-                    microphone = sr.Microphone(device_index=self.device_index)
-                    with microphone as source:
-                        # Very quick ambient check
+                    # Keep one open stream across phrases - reopened only after errors
+                    if source is None:
+                        microphone = self._open_microphone()
+                        source = microphone.__enter__()
+                        last_calibration = 0.0
+                    
+                    # Quick ambient check on (re)open and then once a minute
+                    if time.monotonic() - last_calibration > AMBIENT_RECHECK_SECONDS:
                         self.recognizer.adjust_for_ambient_noise(source, duration=0.2)
-                        
-                        try:
-                            audio = self.recognizer.listen(
-                                source,
-                                timeout=10,
-                                phrase_time_limit=20
-                            )
-                        except sr.WaitTimeoutError:
-                            # Normal - no speech detected, continue listening
-                            consecutive_errors = 0
-                            continue
+                        last_calibration = time.monotonic()
+                    
+                    try:
+                        audio = self.recognizer.listen(
+                            source,
+                            timeout=10,
+                            phrase_time_limit=20
+                        )
+                    except sr.WaitTimeoutError:
+                        # Normal - no speech detected, continue listening
+                        consecutive_errors = 0
+                        continue
                     
                     # Got audio, process it
                     consecutive_errors = 0
                     self._process_audio(audio)
                     
+                    # The stream kept recording while the command ran and the
+                    # reply played - drop that (our own voice included) and
+                    # recalibrate before listening again
+                    self._discard_buffered_input(source)
+                    last_calibration = 0.0
+                    
                 except sr.WaitTimeoutError:
                     consecutive_errors = 0
                     continue
                 except (OSError, IOError) as e:
+                    close_microphone()
                     consecutive_errors += 1
                     err_msg = str(e)[:60]
                     if consecutive_errors <= 2:
@@ -386,39 +512,43 @@ class SmartSpeechRecognizer:
                         time.sleep(1)
                 except AttributeError as e:
                     # Handle NoneType errors from closed streams
+                    close_microphone()
                     consecutive_errors += 1
                     if consecutive_errors <= 2:
                         print(f"[!] Stream error ({consecutive_errors}): {str(e)[:40]}")
                     time.sleep(1)
                 except Exception as e:
+                    close_microphone()
                     consecutive_errors += 1
                     err_str = str(e)
                     if consecutive_errors <= 2 and err_str and "aborted" not in err_str.lower():
                         print(f"[!] Listen error ({consecutive_errors}): {type(e).__name__}")
                     time.sleep(0.5)
-                finally:
-                    # Clean up microphone reference
-                    microphone = None
+        
+        close_microphone()
+    
+    def _discard_buffered_input(self, source):
+        """Throw away audio the open stream buffered since the last listen()"""
+        stream = source.stream.pyaudio_stream
+        available = stream.get_read_available()
+        if available > 0:
+            stream.read(available, exception_on_overflow=False)
     
     def _process_audio(self, audio):
         """Process captured audio and handle commands"""
         try:
             print("[...] Processing speech...")
             
-            # Try recognition with configured language or auto-detect
-            text = None
-            if SPEECH_LANGUAGE == "auto":
-                # Try English first, then Russian
-                for lang in ["en-US", "ru-RU"]:
-                    try:
-                        text = self.recognizer.recognize_google(audio, language=lang).lower().strip()
-                        if text:
-                            break
-                    except:
-                        continue
-            else:
-                lang_code = LANGUAGE_CODES.get(SPEECH_LANGUAGE, "en-US")
-                text = self.recognizer.recognize_google(audio, language=lang_code).lower().strip()
+            # Local Whisper when available, Google as the fallback
+            transcribed = False
+            if self._whisper is not None:
+                try:
+                    text = self._transcribe_local(audio)
+                    transcribed = True
+                except Exception as e:
+                    print(f"[!] Local recognition failed, using Google: {e}")
+            if not transcribed:
+                text = self._recognize_google(audio)
             
             if not text:
                 return
@@ -432,20 +562,15 @@ class SmartSpeechRecognizer:
             
             if not self.is_awake:
                 # Check for any configured wake word
-                is_wake = any(ww in text for ww in self.wake_words)
+                wake = self._wake_re.search(text)
                 
-                if is_wake:
+                if wake:
                     self.is_awake = True
                     self.last_interaction = time.time()
                     print("[AWAKE] Wake word detected! Listening for commands...")
                     
                     # Extract command after wake word
-                    command = text
-                    for ww in self.wake_words:
-                        if ww in text:
-                            idx = text.find(ww)
-                            command = text[idx + len(ww):].strip()
-                            break
+                    command = text[wake.end():].strip()
                     
                     if command:
                         self.callback(command)
@@ -457,28 +582,9 @@ class SmartSpeechRecognizer:
                 
                 # Only sleep on explicit farewell phrases (at start of sentence or standalone)
                 # Don't sleep on "thank you" in the middle of a longer sentence
-                sleep_phrases_strict = ["goodbye", "go to sleep", "that's all", 
-                                       "bye bye", "see you", "goodnight", "stop listening", 
-                                       "nevermind", "never mind", "пока", "до свидания"]
-                
-                # These only trigger sleep if they're the whole message or at the start
-                sleep_phrases_start = ["thanks", "thank you", "bye", "спасибо"]
-                
                 text_clean = text.strip().lower()
                 
-                # Check strict phrases anywhere
-                should_sleep = any(phrase in text_clean for phrase in sleep_phrases_strict)
-                
-                # Check start phrases only if at beginning or standalone
-                if not should_sleep:
-                    for phrase in sleep_phrases_start:
-                        if text_clean == phrase or text_clean.startswith(phrase + " ") or text_clean.startswith(phrase + ","):
-                            # Only sleep if it's short (likely a farewell, not mid-conversation)
-                            if len(text_clean) < 30:
-                                should_sleep = True
-                                break
-                
-                if should_sleep:
+                if _SLEEP_RE.search(text_clean):
                     self.is_awake = False
                     self.last_interaction = 0
                     print(f"[SLEEP] Going to sleep... say '{self.wake_word}' to wake me up")
@@ -488,6 +594,35 @@ class SmartSpeechRecognizer:
         except sr.RequestError as e:
             print(f"[!] Google Speech API error: {e}")
     
+    def _recognize_google(self, audio) -> Optional[str]:
+        """Recognize with Google using the configured language or auto-detect"""
+        if SPEECH_LANGUAGE == "auto":
+            # English wins if it understood anything, else Russian - both are
+            # requested at once so the Russian answer is ready by then
+            futures = [_GOOGLE_POOL.submit(self.recognizer.recognize_google, audio, language=lang)
+                       for lang in ("en-US", "ru-RU")]
+            for future in futures:
+                try:
+                    text = future.result().lower().strip()
+                    if text:
+                        return text
+                except:
+                    continue
+            return None
+        
+        lang_code = LANGUAGE_CODES.get(SPEECH_LANGUAGE, "en-US")
+        return self.recognizer.recognize_google(audio, language=lang_code).lower().strip()
+    
+    def _transcribe_local(self, audio) -> str:
+        """Transcribe captured audio with the local Whisper model"""
+        import numpy as np
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768
+        language = None if SPEECH_LANGUAGE == "auto" else SPEECH_LANGUAGE
+        segments, _ = self._whisper.transcribe(samples, beam_size=1, vad_filter=True, language=language)
+        text = "".join(segment.text for segment in segments)
+        return _PUNCT_RE.sub("", text).lower().strip()
+    
     def listen_once(self) -> Optional[str]:
         """Listen for a single command with smart silence detection"""
         if self.device_index is None:
@@ -495,7 +630,7 @@ class SmartSpeechRecognizer:
         
         with suppress_alsa_errors():
             try:
-                with sr.Microphone(device_index=self.device_index) as source:
+                with self._open_microphone() as source:
                     print("Listening... (speak naturally)")
                     self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
                     
@@ -542,14 +677,33 @@ class HumanVoiceTTS:
         self.engine_type = TTS_ENGINE
         self.is_speaking = False
         self.speak_lock = threading.Lock()  # Prevent voice overlap
+        self._active_proc = None  # Player process stop() should kill
+        
+        # One long-lived worker speaks queued text in order (see speak_async)
+        self._speak_queue = queue.Queue()
+        self._speak_worker = threading.Thread(target=self._speak_loop, daemon=True)
+        self._speak_worker.start()
+        # One event loop thread serves every Edge TTS request
+        self._loop = None
+        if EDGE_TTS_AVAILABLE:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
         self.temp_dir = Path(tempfile.gettempdir()) / "friday_audio"
         self.temp_dir.mkdir(exist_ok=True)
+        # Stat-and-unlink of old cached phrases happens off the startup path
+        threading.Thread(target=self._trim_tts_cache, daemon=True).start()
+        self._tts_cache_writes = itertools.count(1)
         
         self.audio_player = find_audio_player()
+        self.refresh_voice()
         
-        if OPENAI_AVAILABLE and OPENAI_API_KEY and len(OPENAI_API_KEY) > 20:
+        if OPENAI_API_KEY and len(OPENAI_API_KEY) > 20:
             try:
+                # Imported here so the SDK only loads if the OpenAI voice is used
+                from openai import OpenAI
                 self.openai_client = OpenAI(api_key=OPENAI_API_KEY)
+            except ImportError:
+                self.openai_client = None
             except Exception as e:
                 print(f"[!] OpenAI client error: {e}")
                 self.openai_client = None
@@ -586,23 +740,15 @@ class HumanVoiceTTS:
     
     def _is_russian(self, text: str) -> bool:
         """Check if text contains Russian characters"""
-        russian_chars = set('абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ')
-        return any(char in russian_chars for char in text)
+        return _CYRILLIC_RE.search(text) is not None
     
     def _clean_text_for_speech(self, text: str) -> str:
         """Clean text for natural speech - remove symbols that shouldn't be spoken"""
-        import re
-        # Remove asterisks, underscores (markdown)
-        text = re.sub(r'[\*_~`]', '', text)
-        # Remove multiple periods (ellipsis spoken weird)
-        text = re.sub(r'\.{2,}', '.', text)
-        # Remove bullet points
-        text = re.sub(r'^[\-•▪►]\s*', '', text, flags=re.MULTILINE)
-        # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
+        # Drop markdown, bullet points and URLs; an ellipsis (spoken weird) becomes "."
+        if any(trigger in text for trigger in _CLEAN_TRIGGERS):
+            text = _CLEAN_RE.sub(_clean_match, text)
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return " ".join(text.split())
     
     def speak(self, text: str, block: bool = True):
         """Speak text with human-like voice"""
@@ -619,7 +765,10 @@ class HumanVoiceTTS:
             self.is_speaking = True
             
             try:
-                if self.engine_type == "openai":
+                sentences = _SENTENCE_END_RE.split(text) if block else [text]
+                if len(sentences) > 1 and self._can_pipeline():
+                    self._speak_sentences(sentences)
+                elif self.engine_type == "openai":
                     self._speak_openai(text, block)
                 elif self.engine_type == "edge":
                     self._speak_edge(text, block)
@@ -632,11 +781,85 @@ class HumanVoiceTTS:
             finally:
                 self.is_speaking = False
     
-    def _speak_openai(self, text: str, block: bool):
-        """Use OpenAI's neural TTS"""
+    def speak_async(self, text: str):
+        """Queue text for the speech worker and return immediately"""
+        if text:
+            self._speak_queue.put(text)
+    
+    def _speak_loop(self):
+        """Worker loop - speak queued text one utterance at a time"""
+        while True:
+            text = self._speak_queue.get()
+            if text is None:
+                return
+            self.speak(text)
+    
+    def _can_pipeline(self) -> bool:
+        """True if the engine produces whole files worth pipelining per sentence"""
+        if self.engine_type == "openai":
+            return True
+        return self.engine_type == "edge" and not self._edge_streams()
+    
+    def _speak_sentences(self, sentences: list):
+        """Synthesize the next sentence while the current one plays"""
+        synth = self._synth_openai if self.engine_type == "openai" else self._synth_edge
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(synth, sentences[0])
+            for i, _ in enumerate(sentences):
+                if not self.is_speaking:
+                    return  # stop() was called
+                try:
+                    audio_path = pending.result()
+                except Exception as e:
+                    # Only the sentences not yet played go to the fallback
+                    print(f"[!] TTS error with {self.engine_type}: {e}")
+                    self._speak_pyttsx3(" ".join(sentences[i:]), True)
+                    return
+                if i + 1 < len(sentences):
+                    pending = pool.submit(synth, sentences[i + 1])
+                self._play_audio(audio_path, True)
+    
+    def _tts_cache_path(self, engine: str, voice: str, text: str) -> Path:
+        """Cache file for this exact phrase, voice and engine"""
+        key = f"{engine}|{voice}|{VOICE_SPEED}|{text}".encode()
+        return self.temp_dir / f"tts_{hashlib.blake2b(key, digest_size=16).hexdigest()}.mp3"
+    
+    def _tts_cached(self, audio_path: Path) -> bool:
+        """Check for a cached phrase and mark it recently used"""
+        try:
+            os.utime(audio_path)
+            return True
+        except OSError:
+            return False
+    
+    def _trim_tts_cache(self):
+        """Drop the least recently used cached phrases beyond TTS_CACHE_MAX_FILES"""
+        try:
+            files = sorted(self.temp_dir.glob("tts_*.mp3"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for old in files[TTS_CACHE_MAX_FILES:]:
+                old.unlink()
+        except OSError:
+            pass
+    
+    def _add_to_tts_cache(self, tmp_path: Path, audio_path: Path):
+        """Move a finished phrase into the cache, trimming it every few additions"""
+        os.replace(tmp_path, audio_path)
+        if next(self._tts_cache_writes) % TTS_CACHE_TRIM_EVERY == 0:
+            threading.Thread(target=self._trim_tts_cache, daemon=True).start()
+    
+    def _tmp_audio_path(self) -> Path:
+        """Fresh file to synthesize into before it is moved into the cache"""
+        return self.temp_dir / f"speech_{os.getpid()}_{next(_TMP_AUDIO_IDS)}.mp3"
+    
+    def _synth_openai(self, text: str) -> Path:
+        """Synthesize text with OpenAI's neural TTS (cached by phrase)"""
         if not self.openai_client:
             raise Exception("OpenAI client not available")
         
+        audio_path = self._tts_cache_path("openai", OPENAI_VOICE, text)
+        if self._tts_cached(audio_path):
+            return audio_path
+        
         response = self.openai_client.audio.speech.create(
             model="tts-1-hd",
             voice=OPENAI_VOICE,
@@ -644,49 +867,109 @@ class HumanVoiceTTS:
             speed=VOICE_SPEED
         )
         
-        audio_path = self.temp_dir / f"speech_{int(time.time())}.mp3"
-        response.stream_to_file(str(audio_path))
-        
-        self._play_audio(audio_path, block)
+        # Write under a temp name so a half-written file is never replayed
+        tmp_path = self._tmp_audio_path()
+        response.stream_to_file(str(tmp_path))
+        self._add_to_tts_cache(tmp_path, audio_path)
+        return audio_path
+    
+    def _speak_openai(self, text: str, block: bool):
+        """Use OpenAI's neural TTS"""
+        self._play_audio(self._synth_openai(text), block)
+    
+    def _edge_voice(self, text: str) -> str:
+        """Edge voice for this text - settings voice, or Russian for Cyrillic text"""
+        # Auto-detect Russian text and switch voice
+        if self._is_russian(text):
+            return EDGE_TTS_VOICES.get("ru", "ru-RU-SvetlanaNeural")
         
+        return self.voice
+    
+    def refresh_voice(self):
+        """Re-read the Edge voice from settings - call after settings are saved"""
         try:
-            audio_path.unlink()
+            from settings import get_voice_id
+            self.voice = get_voice_id()
         except:
-            pass
+            self.voice = TTS_VOICE
+    
+    def _edge_streams(self) -> bool:
+        """mpv and ffplay can play MP3 from stdin while it is synthesized"""
+        player = self.audio_player
+        return isinstance(player, list) and player[0] in ("mpv", "ffplay")
+    
+    def _synth_edge(self, text: str) -> Path:
+        """Synthesize text with Edge TTS (cached by phrase) - worker threads"""
+        voice = self._edge_voice(text)
+        audio_path = self._tts_cache_path("edge", voice, text)
+        if self._tts_cached(audio_path):
+            return audio_path
+        
+        tmp_path = self._tmp_audio_path()
+        self._run_async(edge_tts.Communicate(text, voice).save(str(tmp_path)))
+        self._add_to_tts_cache(tmp_path, audio_path)
+        return audio_path
     
     def _speak_edge(self, text: str, block: bool):
         """Use Microsoft Edge TTS - free neural voices"""
+        voice = self._edge_voice(text)
+        audio_path = self._tts_cache_path("edge", voice, text)
+        if self._tts_cached(audio_path):
+            self._play_audio(audio_path, block)
+            return
+        
+        # mpv and ffplay can play MP3 from stdin, so audio starts with the
+        # first chunk instead of after the whole file is synthesized
+        player = self.audio_player
+        streaming = self._edge_streams()
+        tmp_path = self._tmp_audio_path()
+        
         async def _generate():
-            # Get voice from settings (F.R.I.D.A.Y. only)
-            try:
-                from settings import get_voice_id
-                voice = get_voice_id()
-            except:
-                voice = TTS_VOICE
-            
-            # Auto-detect Russian text and switch voice
-            if self._is_russian(text):
-                voice = EDGE_TTS_VOICES.get("ru", "ru-RU-SvetlanaNeural")
-            
+            await edge_tts.Communicate(text, voice).save(str(tmp_path))
+        
+        async def _stream():
             communicate = edge_tts.Communicate(text, voice)
-            audio_path = self.temp_dir / f"speech_{int(time.time())}.mp3"
-            await communicate.save(str(audio_path))
-            return audio_path
+            source = "-" if player[0] == "mpv" else "pipe:0"
+            proc = subprocess.Popen(player + [source], stdin=subprocess.PIPE,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self._active_proc = proc
+            complete = False
+            try:
+                # Tee the stream into the cache file while it plays
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in communicate.stream():
+                        if chunk["type"] == "audio":
+                            f.write(chunk["data"])
+                            proc.stdin.write(chunk["data"])
+                complete = True
+            except BrokenPipeError:
+                pass  # Player was stopped mid-sentence
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+                if complete:
+                    self._add_to_tts_cache(tmp_path, audio_path)
+                else:
+                    tmp_path.unlink(missing_ok=True)
+            return proc
         
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        if streaming:
+            proc = self._run_async(_stream())
+            if block:
+                proc.wait()
+            return
         
-        audio_path = loop.run_until_complete(_generate())
+        # paplay/aplay/pygame need a complete file
+        self._run_async(_generate())
+        self._add_to_tts_cache(tmp_path, audio_path)
         
         self._play_audio(audio_path, block)
-        
-        try:
-            audio_path.unlink()
-        except:
-            pass
+    
+    def _run_async(self, coro):
+        """Run a coroutine on the Edge TTS loop thread and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
     
     def _speak_pyttsx3(self, text: str, block: bool):
         """Fallback to pyttsx3"""
@@ -708,14 +991,15 @@ class HumanVoiceTTS:
             import platform
             
             if self.audio_player == "pygame":
-                # Use pygame for Windows
+                # Use pygame for Windows - the mixer was opened once by find_audio_player
                 import pygame
-                pygame.mixer.init()
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
                 pygame.mixer.music.load(str(audio_path))
                 pygame.mixer.music.play()
                 if block:
                     while pygame.mixer.music.get_busy():
-                        time.sleep(0.1)
+                        time.sleep(0.02)
             elif self.audio_player == "windows":
                 # Use Windows default player
                 import os
@@ -726,42 +1010,43 @@ class HumanVoiceTTS:
             else:
                 # Linux players (list format)
                 cmd = self.audio_player + [str(audio_path)]
+                proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._active_proc = proc
                 if block:
-                    subprocess.run(cmd, capture_output=True)
-                else:
-                    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    proc.wait()
         except Exception as e:
             print(f"[!] Audio playback error: {e}")
     
     def stop(self):
         """Stop current speech immediately"""
         self.is_speaking = False
-        # Kill any running audio processes - be aggressive
+        # Drop anything still waiting to be spoken
         try:
-            import subprocess
-            import platform
-            system = platform.system()
-            
-            if system == "Windows":
-                # Kill audio players on Windows
-                subprocess.run(['taskkill', '/f', '/im', 'mpv.exe'], capture_output=True, timeout=1)
-                subprocess.run(['taskkill', '/f', '/im', 'ffplay.exe'], capture_output=True, timeout=1)
-                # Stop pygame if playing
-                try:
-                    import pygame
-                    if pygame.mixer.get_init():
-                        pygame.mixer.music.stop()
-                except:
-                    pass
-            else:
-                # Linux/Mac
-                subprocess.run(['pkill', '-9', '-f', 'mpv'], capture_output=True, timeout=1)
-                subprocess.run(['pkill', '-9', '-f', 'ffplay'], capture_output=True, timeout=1)
-                subprocess.run(['pkill', '-9', '-f', 'pw-play'], capture_output=True, timeout=1)
-                subprocess.run(['pkill', '-9', '-f', 'paplay'], capture_output=True, timeout=1)
-        except:
+            while True:
+                self._speak_queue.get_nowait()
+        except queue.Empty:
             pass
         
+        # Kill our own player process - other mpv/ffplay instances are left alone.
+        # No speak_lock here: speak() holds it for the whole playback.
+        proc, self._active_proc = self._active_proc, None
+        if proc and proc.poll() is None:
+            try:
+                proc.terminate()
+                proc.wait(timeout=0.2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            except OSError:
+                pass
+        
+        if self.audio_player == "pygame":
+            try:
+                import pygame
+                if pygame.mixer.get_init():
+                    pygame.mixer.music.stop()
+            except:
+                pass
+        
         if self.pyttsx3_engine:
             try:
                 self.pyttsx3_engine.stop()
@@ -772,6 +1057,9 @@ class HumanVoiceTTS:
         """Complete shutdown of TTS system"""
         self.stop()
         self.engine_type = None
+        self._speak_queue.put(None)  # Let the worker exit
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
 
 
 # Global instances
@@ -3,6 +3,10 @@ Translations for F.R.I.D.A.Y.
 Supports English and Russian
 """
 
+import time
+from functools import lru_cache
+from string import Formatter
+
 TRANSLATIONS = {
     "en": {
         # Window
@@ -164,51 +168,139 @@ TRANSLATIONS = {
 }
 
 
-def get_text(key: str, lang: str = "en", **kwargs) -> str:
-    """Get translated text with placeholder support"""
-    translations = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
-    text = translations.get(key, TRANSLATIONS["en"].get(key, key))
+_EN = TRANSLATIONS["en"]
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+def _compile(template: str):
+    """Parse a template once into (literal, field, spec, conversion) segments
     
-    # Get AI name from settings (avoid circular imports)
-    ai_name = "F.R.I.D.A.Y."
-    wake_word = "friday"
-    try:
-        from settings import load_settings, AI_NAMES
-        settings = load_settings()
+    Templates without placeholders compile straight to their final text.
+    """
+    segments = tuple(Formatter().parse(template))
+    if all(field is None for _, field, _, _ in segments):
+        return "".join(literal for literal, _, _, _ in segments)
+    return segments
+
+
+# lang -> key -> compiled template (nested, so lookups hash two cached
+# str hashes instead of building and hashing a (lang, key) tuple)
+_COMPILED = {
+    lang: {key: _compile(template) for key, template in translations.items()}
+    for lang, translations in TRANSLATIONS.items()
+}
+_COMPILED_EN = _COMPILED["en"]
+
+
+# Settings-derived placeholder values, read once until settings are saved
+_PLACEHOLDER_DEFAULTS = None
+
+# Settings snapshot shared by bursts of lookups (e.g. one GUI rebuild)
+SETTINGS_TTL = 1.0
+_SETTINGS_SNAPSHOT = {"time": 0.0, "data": None}
+
+# The settings module, imported on first use (avoids circular imports);
+# False if it can't be imported, so the failure is only paid once
+_SETTINGS_MODULE = None
+
+
+def invalidate_translation_cache():
+    """Forget cached settings-derived text - called when settings are saved"""
+    global _PLACEHOLDER_DEFAULTS
+    _PLACEHOLDER_DEFAULTS = None
+    _SETTINGS_SNAPSHOT["data"] = None
+    _render.cache_clear()
+
+
+def _settings_module():
+    """The settings module, or False if it is unavailable"""
+    global _SETTINGS_MODULE
+    if _SETTINGS_MODULE is None:
+        try:
+            import settings
+            _SETTINGS_MODULE = settings
+        except Exception:
+            _SETTINGS_MODULE = False
+    return _SETTINGS_MODULE
+
+
+def _load_settings() -> dict:
+    """load_settings(), reused for SETTINGS_TTL seconds - empty without settings"""
+    now = time.monotonic()
+    if _SETTINGS_SNAPSHOT["data"] is None or now - _SETTINGS_SNAPSHOT["time"] >= SETTINGS_TTL:
+        settings = _settings_module()
+        _SETTINGS_SNAPSHOT["data"] = settings.load_settings() if settings else {}
+        _SETTINGS_SNAPSHOT["time"] = now
+    return _SETTINGS_SNAPSHOT["data"]
+
+
+def _placeholder_defaults() -> dict:
+    """Default values for common placeholders (AI name, wake word)"""
+    global _PLACEHOLDER_DEFAULTS
+    if _PLACEHOLDER_DEFAULTS is None:
+        # Get AI name from settings
+        settings = _load_settings()
+        settings_module = _settings_module()
+        ai_names = settings_module.AI_NAMES if settings_module else {}
         voice = settings.get("voice", "F.R.I.D.A.Y. (Irish Female)")
-        ai_name = AI_NAMES.get(voice, settings.get("ai_name", "F.R.I.D.A.Y."))
+        ai_name = ai_names.get(voice, settings.get("ai_name", "F.R.I.D.A.Y."))
         wake_word = settings.get("wake_word", "friday")
-    except Exception:
-        pass
-    
-    # Set default values for common placeholders
-    defaults = {
-        "wake_word": wake_word,
-        "ai_name": ai_name,
-    }
+        _PLACEHOLDER_DEFAULTS = {
+            "wake_word": wake_word,
+            "ai_name": ai_name,
+        }
+    return _PLACEHOLDER_DEFAULTS
+
+
+def _format(key: str, lang: str, kwargs: dict) -> str:
+    """Look up a translation and fill in its placeholders"""
+    # One lookup when the key exists in the requested language
+    compiled = _COMPILED.get(lang, _COMPILED_EN).get(key)
+    if compiled is None:
+        compiled = _COMPILED_EN.get(key)
+        if compiled is None:
+            return key
+    if isinstance(compiled, str):
+        return compiled
     
-    # Merge defaults with provided kwargs
-    for k, v in defaults.items():
-        if k not in kwargs:
-            kwargs[k] = v
+    # Merge defaults with provided kwargs - the shared defaults dict is used
+    # as is when there is nothing to merge (it is only ever read)
+    defaults = _placeholder_defaults()
+    kwargs = {**defaults, **kwargs} if kwargs else defaults
     
-    if kwargs:
-        try:
-            text = text.format(**kwargs)
-        except (KeyError, ValueError):
-            pass
+    parts = []
+    try:
+        for literal, field, spec, conversion in compiled:
+            parts.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                parts.append(format(value, spec))
+    except (KeyError, ValueError):
+        # Leave the template as is, like a failed str.format
+        template = TRANSLATIONS.get(lang, _EN).get(key)
+        return template if template is not None else _EN[key]
     
-    return text
+    return "".join(parts)
+
+
+@lru_cache(maxsize=512)
+def _render(key: str, lang: str) -> str:
+    """Text without extra placeholders - the GUI asks for these on every refresh"""
+    return _format(key, lang, {})
+
+
+def get_text(key: str, lang: str = "en", **kwargs) -> str:
+    """Get translated text with placeholder support"""
+    if not kwargs:
+        return _render(key, lang)
+    return _format(key, lang, kwargs)
 
 
 def get_language() -> str:
     """Get current language from settings"""
-    try:
-        from settings import load_settings
-        settings = load_settings()
-        lang = settings.get("language", "en")
-        if lang == "auto":
-            return "en"  # Default to English for auto
-        return lang
-    except:
-        return "en"
+    lang = _load_settings().get("language", "en")
+    if lang == "auto":
+        return "en"  # Default to English for auto
+    return lang
@@ -3,16 +3,23 @@ Auto-Update Module for F.R.I.D.A.Y.
 Checks GitHub for new releases and updates the app automatically
 """
 
+import base64
+import hashlib
+import http.client
 import json
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import threading
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional, Tuple
 
@@ -21,16 +28,152 @@ GITHUB_OWNER = "Cartus121"
 GITHUB_REPO = "F.R.I.D.A.Y"
 RELEASES_URL = f"https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases/latest"
 TAGS_URL = f"https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}/tags"
+# Per-tag links - fill in {tag}
+TAG_ZIPBALL_URL = f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/archive/refs/tags/{{tag}}.zip"
+TAG_HTML_URL = f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/releases/tag/{{tag}}"
+TAG_ASSET_NAME = f"{GITHUB_REPO}-{{tag}}.zip"
+
+# Release asset name keywords for each platform - fixed for the process
+_PLATFORM_ASSET_KEYWORDS = {
+    "windows": (".exe", "windows"),
+    "linux": ("linux", ".appimage"),
+    "darwin": ("macos", "mac"),
+}
+_ASSET_KEYWORDS = _PLATFORM_ASSET_KEYWORDS.get(platform.system().lower(), ())
+
+# Last GitHub API responses with their ETags, for conditional requests
+API_CACHE_FILE = Path(tempfile.gettempdir()) / "friday_update" / "api_cache.json"
+_API_CACHE = None
+_API_CACHE_LOCK = threading.Lock()
+
+# Idle kept-alive API connections by host - checks after the first skip the TLS handshake
+_API_CONNECTIONS = {}
+_API_CONNECTIONS_LOCK = threading.Lock()
+
+# Read size for update downloads - large reads keep the Python loop short
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
 # Current version - update this when releasing
 CURRENT_VERSION = "stable_v1.2.0"
 
+# stable_v1.0.1 / alpha-v20 / beta-v5 / v1.2.3 - components past the patch are ignored
+_VERSION_RE = re.compile(r'(stable_v|alpha-v|beta-v|v)(\d+)(?:\.(\d+))?(?:\.(\d+))?((?:\.\d+)*)')
+_VERSION_PREFIX_RE = re.compile(r'stable_v|alpha-v|beta-v|v')
+_VERSION_STAGES = {"stable_v": "stable", "alpha-v": "alpha", "beta-v": "beta", "v": "release"}
+# Stage priority: stable/release > beta > alpha
+_STAGE_PRIORITY = {"alpha": 0, "beta": 1, "release": 2, "stable": 2, "unknown": -1}
+# What a recognized prefix with an unparseable number means
+_VERSION_FALLBACK = {
+    "stable_v": ("stable", 1, 0, 0),
+    "alpha-v": ("alpha", 0, 0, 0),
+    "beta-v": ("beta", 0, 0, 0),
+    "v": ("release", 0, 0, 0),
+}
+
+
+# Scripts that replace the running exe after the app exits - filled in
+# with str.format. The Windows one:
+# 1. Waits longer for app to close
+# 2. Retries deletion
+# 3. Cleans up _MEI folders
+# 4. Handles errors gracefully
+_WINDOWS_UPDATE_SCRIPT = '''@echo off
+setlocal enabledelayedexpansion
+title F.R.I.D.A.Y. Update
+echo.
+echo ========================================
+echo   F.R.I.D.A.Y. Auto-Update
+echo ========================================
+echo.
+echo Waiting for application to close...
+timeout /t 3 /nobreak >nul
+
+REM Wait for the old process to fully exit (retry loop)
+set retries=0
+:waitloop
+tasklist /FI "IMAGENAME eq {new_exe_name}" 2>NUL | find /I /N "{new_exe_name}">NUL
+if "%ERRORLEVEL%"=="0" (
+    set /a retries+=1
+    if !retries! GEQ 15 (
+        echo Warning: Old process still running, forcing update...
+        goto :continue_update
+    )
+    echo Waiting for process to close... attempt !retries!/15
+    timeout /t 1 /nobreak >nul
+    goto :waitloop
+)
+
+:continue_update
+echo.
+echo Removing old version...
+
+REM Try to delete the old exe multiple times
+set del_retries=0
+:del_loop
+del /f /q "{current_exe}" >nul 2>&1
+if exist "{current_exe}" (
+    set /a del_retries+=1
+    if !del_retries! GEQ 10 (
+        echo Warning: Could not delete old exe, will overwrite...
+        goto :copy_new
+    )
+    timeout /t 1 /nobreak >nul
+    goto :del_loop
+)
+
+:copy_new
+echo Installing new version...
+copy /y "{downloaded_file}" "{new_exe_path}" >nul
+if errorlevel 1 (
+    echo ERROR: Failed to copy new version!
+    echo Please manually copy:
+    echo   From: {downloaded_file}
+    echo   To: {new_exe_path}
+    pause
+    exit /b 1
+)
+
+echo Cleaning up...
+del /f /q "{downloaded_file}" >nul 2>&1
+
+REM Clean up old PyInstaller temp folders (older than current)
+for /d %%i in ("%TEMP%\\_MEI*") do (
+    rd /s /q "%%i" >nul 2>&1
+)
+
+REM Clean up friday_update folder
+rd /s /q "%TEMP%\\friday_update" >nul 2>&1
+
+echo.
+echo ========================================
+echo   Update complete! Starting F.R.I.D.A.Y...
+echo ========================================
+timeout /t 2 /nobreak >nul
+
+REM Start the new version
+start "" "{new_exe_path}"
+
+REM Delete this script
+(goto) 2>nul & del /f /q "%~f0"
+'''
+
+_LINUX_UPDATE_SCRIPT = '''#!/bin/bash
+sleep 2
+rm -f "{current_exe}"
+cp "{downloaded_file}" "{new_exe_path}"
+chmod +x "{new_exe_path}"
+rm -f "{downloaded_file}"
+"{new_exe_path}" &
+rm -f "$0"
+'''
+
 
 def get_current_version() -> str:
     """Get current version"""
     return CURRENT_VERSION
 
 
+@lru_cache(maxsize=256)
 def parse_version(version: str) -> Tuple[str, int, int, int]:
     """Parse version string into (stage, major, minor, patch)
     
@@ -41,75 +184,138 @@ def parse_version(version: str) -> Tuple[str, int, int, int]:
     - v1.2.3 -> (release, 1, 2, 3)
     """
     version = version.lower().strip()
+    match = _VERSION_RE.fullmatch(version)
+    if not match:
+        prefix = _VERSION_PREFIX_RE.match(version)
+        return _VERSION_FALLBACK.get(prefix and prefix.group(), ("unknown", 0, 0, 0))
     
-    # stable_v1.0.1 format
-    if version.startswith("stable_v"):
-        try:
-            parts = version.replace("stable_v", "").split(".")
-            major = int(parts[0]) if len(parts) > 0 else 0
-            minor = int(parts[1]) if len(parts) > 1 else 0
-            patch = int(parts[2]) if len(parts) > 2 else 0
-            return ("stable", major, minor, patch)
-        except ValueError:
-            return ("stable", 1, 0, 0)
+    prefix, major, minor, patch, extra = match.groups()
+    stage = _VERSION_STAGES[prefix]
+    if stage in ("alpha", "beta") and (minor or extra):
+        # alpha-v20.1 is not a valid build number
+        return _VERSION_FALLBACK[prefix]
+    return (stage, int(major), int(minor or 0), int(patch or 0))
+
+
+@lru_cache(maxsize=256)
+def is_newer_version(latest: str, current: str) -> bool:
+    """Check if latest version is newer than current"""
+    latest_stage, *latest_numbers = parse_version(latest)
+    current_stage, *current_numbers = parse_version(current)
     
-    # alpha-v20 format
-    elif version.startswith("alpha-v"):
+    # Stage first, then (major, minor, patch) - tuples compare in that order
+    return ((_STAGE_PRIORITY.get(latest_stage, -1), *latest_numbers) >
+            (_STAGE_PRIORITY.get(current_stage, -1), *current_numbers))
+
+
+def _load_api_cache() -> dict:
+    """Cached GitHub API responses: url -> {"etag": ..., "data": ...}"""
+    global _API_CACHE
+    if _API_CACHE is None:
         try:
-            num = int(version.replace("alpha-v", ""))
-            return ("alpha", num, 0, 0)
-        except ValueError:
-            return ("alpha", 0, 0, 0)
+            with open(API_CACHE_FILE, 'r') as f:
+                _API_CACHE = json.load(f)
+        except (OSError, ValueError):
+            _API_CACHE = {}
+    return _API_CACHE
+
+
+def _new_api_connection(parts: urllib.parse.SplitResult) -> http.client.HTTPConnection:
+    """Open a connection to the URL's host, tunnelled through the system proxy if one is set"""
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    # Same proxy lookup urlopen does - environment variables, or the registry on Windows
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname):
+        return connection_class(parts.netloc, timeout=10)
     
-    # beta-v5 format
-    elif version.startswith("beta-v"):
-        try:
-            num = int(version.replace("beta-v", ""))
-            return ("beta", num, 0, 0)
-        except ValueError:
-            return ("beta", 0, 0, 0)
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    proxy_parts = urllib.parse.urlsplit(proxy)
+    tunnel_headers = {}
+    if proxy_parts.username:
+        credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+    connection = connection_class(proxy_parts.hostname, proxy_parts.port or 8080, timeout=10)
+    connection.set_tunnel(parts.hostname, parts.port, headers=tunnel_headers)
+    return connection
+
+
+def _api_get(url: str, headers: dict):
+    """GET url over a pooled keep-alive connection -> (status, headers, body)"""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path + ("?" + parts.query if parts.query else "")
     
-    # v1.2.3 format
-    elif version.startswith("v"):
+    for attempt in range(2):
+        connection = None
+        if attempt == 0:
+            with _API_CONNECTIONS_LOCK:
+                idle = _API_CONNECTIONS.get(parts.netloc)
+                if idle:
+                    connection = idle.pop()
+        if connection is None:
+            connection = _new_api_connection(parts)
+        
         try:
-            parts = version.replace("v", "").split(".")
-            major = int(parts[0]) if len(parts) > 0 else 0
-            minor = int(parts[1]) if len(parts) > 1 else 0
-            patch = int(parts[2]) if len(parts) > 2 else 0
-            return ("release", major, minor, patch)
-        except ValueError:
-            return ("release", 0, 0, 0)
-    
-    return ("unknown", 0, 0, 0)
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, ConnectionError):
+            # A pooled connection the server already closed - retry on a new one
+            connection.close()
+            if attempt:
+                raise
+            continue
+        except Exception:
+            connection.close()
+            raise
+        
+        if response.will_close:
+            connection.close()
+        else:
+            with _API_CONNECTIONS_LOCK:
+                _API_CONNECTIONS.setdefault(parts.netloc, []).append(connection)
+        return response.status, response.headers, body
 
 
-def is_newer_version(latest: str, current: str) -> bool:
-    """Check if latest version is newer than current"""
-    latest_stage, latest_major, latest_minor, latest_patch = parse_version(latest)
-    current_stage, current_major, current_minor, current_patch = parse_version(current)
+def _get_json(url: str, redirects: int = 3):
+    """GET a GitHub API URL, revalidating the cached copy by its ETag
     
-    # Stage priority: stable/release > beta > alpha
-    stage_order = {"alpha": 0, "beta": 1, "release": 2, "stable": 2, "unknown": -1}
+    An unchanged resource comes back as an empty 304, which GitHub does
+    not count against the unauthenticated rate limit.
+    """
+    with _API_CACHE_LOCK:
+        cached = _load_api_cache().get(url)
     
-    latest_priority = stage_order.get(latest_stage, -1)
-    current_priority = stage_order.get(current_stage, -1)
+    headers = {"User-Agent": "F.R.I.D.A.Y-Updater/1.0"}
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    status, response_headers, body = _api_get(url, headers)
     
-    if latest_priority > current_priority:
-        return True
-    elif latest_priority < current_priority:
-        return False
-    else:
-        # Same stage, compare version numbers
-        if latest_major > current_major:
-            return True
-        elif latest_major < current_major:
-            return False
-        elif latest_minor > current_minor:
-            return True
-        elif latest_minor < current_minor:
-            return False
-        else:
-            return latest_patch > current_patch
+    if status == 304 and cached:
+        return cached["data"]
+    if status in (301, 302, 307, 308) and redirects > 0:
+        location = urllib.parse.urljoin(url, response_headers.get("Location", ""))
+        return _get_json(location, redirects - 1)
+    if status != 200:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ""),
+                                     response_headers, None)
+    
+    data = json.loads(body)
+    etag = response_headers.get("ETag")
+    if etag:
+        with _API_CACHE_LOCK:
+            cache = _load_api_cache()
+            cache[url] = {"etag": etag, "data": data}
+            try:
+                API_CACHE_FILE.parent.mkdir(exist_ok=True)
+                tmp_path = API_CACHE_FILE.with_name(API_CACHE_FILE.name + ".tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, API_CACHE_FILE)
+            except OSError:
+                pass  # Next check just downloads in full again
+    
+    return data
 
 
 def check_for_updates() -> Optional[dict]:
@@ -117,56 +323,44 @@ def check_for_updates() -> Optional[dict]:
     Check GitHub for new releases or tags
     Returns dict with version info if update available, None otherwise
     """
-    # First try releases API
-    update_info = _check_releases()
-    if update_info:
-        return update_info
+    # Ask both APIs at once - releases win, tags are the fallback for when
+    # releases don't exist. The tags request is usually a free ETag 304.
+    # A daemon thread (unlike an executor worker) never holds up app exit.
+    tags = []
+    
+    def _fetch_tags():
+        tags.append(_check_tags())
     
-    # Fall back to tags API (for when releases don't exist)
-    return _check_tags()
+    tags_thread = threading.Thread(target=_fetch_tags, daemon=True)
+    tags_thread.start()
+    
+    release = _check_releases()
+    if release:
+        return release  # Don't wait on tags once a release was found
+    tags_thread.join()
+    return tags[0] if tags else None
 
 
 def _check_releases() -> Optional[dict]:
     """Check GitHub releases for updates"""
     try:
-        request = urllib.request.Request(
-            RELEASES_URL,
-            headers={"User-Agent": "F.R.I.D.A.Y-Updater/1.0"}
-        )
-        
-        with urllib.request.urlopen(request, timeout=10) as response:
-            data = json.loads(response.read().decode())
+        data = _get_json(RELEASES_URL)
         
         latest_version = data.get("tag_name", "")
         
         if is_newer_version(latest_version, CURRENT_VERSION):
             # Find the right asset for this platform
-            system = platform.system().lower()
-            
-            download_url = None
-            asset_name = None
-            
-            for asset in data.get("assets", []):
-                name = asset.get("name", "").lower()
-                
-                if system == "windows" and (".exe" in name or "windows" in name):
-                    download_url = asset.get("browser_download_url")
-                    asset_name = asset.get("name")
-                    break
-                elif system == "linux" and ("linux" in name or ".appimage" in name.lower()):
-                    download_url = asset.get("browser_download_url")
-                    asset_name = asset.get("name")
-                    break
-                elif system == "darwin" and ("macos" in name or "mac" in name):
-                    download_url = asset.get("browser_download_url")
-                    asset_name = asset.get("name")
-                    break
+            asset = next((a for a in data.get("assets", ())
+                          if any(k in a.get("name", "").lower() for k in _ASSET_KEYWORDS)), {})
+            # GitHub publishes asset checksums as "sha256:<hex>"
+            digest = asset.get("digest") or ""
             
             return {
                 "version": latest_version,
                 "current": CURRENT_VERSION,
-                "download_url": download_url,
-                "asset_name": asset_name,
+                "download_url": asset.get("browser_download_url"),
+                "asset_name": asset.get("name"),
+                "sha256": digest[7:] if digest.startswith("sha256:") else None,
                 "release_notes": data.get("body", ""),
                 "html_url": data.get("html_url", ""),
                 "source": "release"
@@ -182,13 +376,7 @@ def _check_releases() -> Optional[dict]:
 def _check_tags() -> Optional[dict]:
     """Check GitHub tags for updates (fallback when no releases)"""
     try:
-        request = urllib.request.Request(
-            TAGS_URL,
-            headers={"User-Agent": "F.R.I.D.A.Y-Updater/1.0"}
-        )
-        
-        with urllib.request.urlopen(request, timeout=10) as response:
-            tags = json.loads(response.read().decode())
+        tags = _get_json(TAGS_URL)
         
         if not tags:
             return None
@@ -198,15 +386,13 @@ def _check_tags() -> Optional[dict]:
         
         if is_newer_version(latest_tag, CURRENT_VERSION):
             # No downloadable asset from tags - provide source download link
-            zipball_url = f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/archive/refs/tags/{latest_tag}.zip"
-            
             return {
                 "version": latest_tag,
                 "current": CURRENT_VERSION,
-                "download_url": zipball_url,
-                "asset_name": f"{GITHUB_REPO}-{latest_tag}.zip",
+                "download_url": TAG_ZIPBALL_URL.format(tag=latest_tag),
+                "asset_name": TAG_ASSET_NAME.format(tag=latest_tag),
                 "release_notes": f"New version {latest_tag} is available!\nPlease download and rebuild, or wait for an official release.",
-                "html_url": f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/releases/tag/{latest_tag}",
+                "html_url": TAG_HTML_URL.format(tag=latest_tag),
                 "source": "tag"  # Indicates this came from tag, not release
             }
         
@@ -217,9 +403,10 @@ def _check_tags() -> Optional[dict]:
         return None
 
 
-def download_update(download_url: str, progress_callback: Callable[[float], None] = None) -> Optional[str]:
+def download_update(download_url: str, progress_callback: Callable[[float], None] = None,
+                    sha256: Optional[str] = None) -> Optional[str]:
     """
-    Download update file
+    Download update file, verifying it against sha256 when given
     Returns path to downloaded file, or None on failure
     """
     if not download_url:
@@ -240,20 +427,35 @@ def download_update(download_url: str, progress_callback: Callable[[float], None
             headers={"User-Agent": "F.R.I.D.A.Y-Updater/1.0"}
         )
         
-        with urllib.request.urlopen(request, timeout=300) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+        # Download under a temporary name - only a complete, verified file
+        # ever shows up at download_path
+        part_path = download_path.with_name(download_path.name + ".part")
+        try:
+            with urllib.request.urlopen(request, timeout=300) as response:
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded = 0
+                
+                # Hash while downloading - no second pass over the file
+                digest = hashlib.sha256()
+                with open(part_path, 'wb') as f:
+                    while True:
+                        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        digest.update(chunk)
+                        downloaded += len(chunk)
+                        
+                        if progress_callback and total_size > 0:
+                            progress_callback(downloaded / total_size)
+            
+            if sha256 and digest.hexdigest() != sha256.lower():
+                print("[Updater] Download checksum mismatch - discarding it")
+                return None
             
-            with open(download_path, 'wb') as f:
-                while True:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    
-                    if progress_callback and total_size > 0:
-                        progress_callback(downloaded / total_size)
+            os.replace(part_path, download_path)
+        finally:
+            part_path.unlink(missing_ok=True)
         
         return str(download_path)
         
@@ -306,90 +508,12 @@ def _install_windows(downloaded_file: str) -> bool:
         new_exe_name = os.path.basename(current_exe)
         new_exe_path = os.path.join(exe_dir, new_exe_name)
         
-        # More robust batch script that:
-        # 1. Waits longer for app to close
-        # 2. Retries deletion
-        # 3. Cleans up _MEI folders
-        # 4. Handles errors gracefully
-        batch_content = f'''@echo off
-setlocal enabledelayedexpansion
-title F.R.I.D.A.Y. Update
-echo.
-echo ========================================
-echo   F.R.I.D.A.Y. Auto-Update
-echo ========================================
-echo.
-echo Waiting for application to close...
-timeout /t 3 /nobreak >nul
-
-REM Wait for the old process to fully exit (retry loop)
-set retries=0
-:waitloop
-tasklist /FI "IMAGENAME eq {new_exe_name}" 2>NUL | find /I /N "{new_exe_name}">NUL
-if "%ERRORLEVEL%"=="0" (
-    set /a retries+=1
-    if !retries! GEQ 15 (
-        echo Warning: Old process still running, forcing update...
-        goto :continue_update
-    )
-    echo Waiting for process to close... attempt !retries!/15
-    timeout /t 1 /nobreak >nul
-    goto :waitloop
-)
-
-:continue_update
-echo.
-echo Removing old version...
-
-REM Try to delete the old exe multiple times
-set del_retries=0
-:del_loop
-del /f /q "{current_exe}" >nul 2>&1
-if exist "{current_exe}" (
-    set /a del_retries+=1
-    if !del_retries! GEQ 10 (
-        echo Warning: Could not delete old exe, will overwrite...
-        goto :copy_new
-    )
-    timeout /t 1 /nobreak >nul
-    goto :del_loop
-)
-
-:copy_new
-echo Installing new version...
-copy /y "{downloaded_file}" "{new_exe_path}" >nul
-if errorlevel 1 (
-    echo ERROR: Failed to copy new version!
-    echo Please manually copy:
-    echo   From: {downloaded_file}
-    echo   To: {new_exe_path}
-    pause
-    exit /b 1
-)
-
-echo Cleaning up...
-del /f /q "{downloaded_file}" >nul 2>&1
-
-REM Clean up old PyInstaller temp folders (older than current)
-for /d %%i in ("%TEMP%\\_MEI*") do (
-    rd /s /q "%%i" >nul 2>&1
-)
-
-REM Clean up friday_update folder
-rd /s /q "%TEMP%\\friday_update" >nul 2>&1
-
-echo.
-echo ========================================
-echo   Update complete! Starting F.R.I.D.A.Y...
-echo ========================================
-timeout /t 2 /nobreak >nul
-
-REM Start the new version
-start "" "{new_exe_path}"
-
-REM Delete this script
-(goto) 2>nul & del /f /q "%~f0"
-'''
+        batch_content = _WINDOWS_UPDATE_SCRIPT.format(
+            new_exe_name=new_exe_name,
+            current_exe=current_exe,
+            downloaded_file=downloaded_file,
+            new_exe_path=new_exe_path,
+        )
         
         with open(update_script, 'w') as f:
             f.write(batch_content)
@@ -423,15 +547,11 @@ def _install_linux(downloaded_file: str) -> bool:
         update_script = os.path.join(exe_dir, "_update.sh")
         new_exe_name = os.path.basename(current_exe)
         
-        shell_content = f'''#!/bin/bash
-sleep 2
-rm -f "{current_exe}"
-cp "{downloaded_file}" "{os.path.join(exe_dir, new_exe_name)}"
-chmod +x "{os.path.join(exe_dir, new_exe_name)}"
-rm -f "{downloaded_file}"
-"{os.path.join(exe_dir, new_exe_name)}" &
-rm -f "$0"
-'''
+        shell_content = _LINUX_UPDATE_SCRIPT.format(
+            current_exe=current_exe,
+            downloaded_file=downloaded_file,
+            new_exe_path=os.path.join(exe_dir, new_exe_name),
+        )
         
         with open(update_script, 'w') as f:
             f.write(shell_content)
@@ -484,7 +604,8 @@ class UpdateChecker:
         
         downloaded = download_update(
             self.update_info["download_url"],
-            progress_callback
+            progress_callback,
+            self.update_info.get("sha256")
         )
         
         if downloaded: